@@ -6,7 +6,8 @@ common parsing and managed-section writing for both adapters.
 
 from __future__ import annotations
 
-import re
+import functools
+from collections.abc import Iterator
 
 CTX_AGENTS_START = "<!-- ctx:start -->"
 CTX_AGENTS_END = "<!-- ctx:end -->"
@@ -15,52 +16,75 @@ CTX_AGENTS_END = "<!-- ctx:end -->"
 def parse_agents_md(text: str) -> list[tuple[str, str]]:
     """Parse AGENTS.md sections into (key, content) pairs.
 
-    Splits by ## headers. Skips any ctx-managed section (between markers).
+    Splits by ## headers, falling back to # headers when the file has no ##
+    headers. Skips any ctx-managed section (between markers).
     Returns list of (slugified_key, raw_section_content) pairs.
     """
+    return list(_parse_agents_md_cached(text))
+
+
+# Adapters re-import the same AGENTS.md over and over (status, sync, polling
+# editors); hashing the text is far cheaper than re-parsing it.
+@functools.lru_cache(maxsize=8)
+def _parse_agents_md_cached(text: str) -> tuple[tuple[str, str], ...]:
+    if not text.strip():
+        return ()
+
     # Remove ctx-managed section first
     clean = _strip_ctx_section(text)
 
+    # Single scan recording both ## and # header offsets; ## headers win if
+    # any are present, otherwise fall back to # headers. Only lines that
+    # start with "#" can be headers, so they are located with find() rather
+    # than splitting the whole file into lines.
+    h2_headers: list[tuple[int, str]] = []
+    h1_headers: list[tuple[int, str]] = []
+    for start in _hash_line_starts(clean):
+        line_end = clean.find("\n", start)
+        header = _parse_header(clean[start:] if line_end < 0 else clean[start:line_end])
+        if header is None:
+            continue
+        level, title = header
+        if level == 2:
+            h2_headers.append((start, title))
+        elif not h2_headers:
+            # Once a ## header is seen the # tier can no longer win
+            h1_headers.append((start, title))
+
+    headers = h2_headers or h1_headers
     sections: list[tuple[str, str]] = []
-    current_key = ""
-    current_lines: list[str] = []
-
-    for line in clean.split("\n"):
-        header_match = re.match(r"^##\s+(.+)", line)
-        if header_match:
-            if current_key and current_lines:
-                sections.append((current_key, "\n".join(current_lines).strip()))
-            raw = header_match.group(1).strip()
-            current_key = _slugify(raw)
-            current_lines = [line]
-        else:
-            current_lines.append(line)
-
-    if current_key and current_lines:
-        sections.append((current_key, "\n".join(current_lines).strip()))
-
-    # If no ## headers found, try # headers
-    if not sections:
-        current_key = ""
-        current_lines = []
-        for line in clean.split("\n"):
-            header_match = re.match(r"^#\s+(.+)", line)
-            if header_match:
-                if current_key and current_lines:
-                    sections.append((current_key, "\n".join(current_lines).strip()))
-                raw = header_match.group(1).strip()
-                current_key = _slugify(raw)
-                current_lines = [line]
-            else:
-                current_lines.append(line)
-        if current_key and current_lines:
-            sections.append((current_key, "\n".join(current_lines).strip()))
+    for n, (start, title) in enumerate(headers):
+        end = headers[n + 1][0] if n + 1 < len(headers) else len(clean)
+        sections.append((_slugify(title), clean[start:end].strip()))
 
     # If still nothing, store as a single entry
     if not sections and clean.strip():
         sections.append(("agents", clean.strip()))
 
-    return sections
+    return tuple(sections)
+
+
+def _hash_line_starts(text: str) -> Iterator[int]:
+    """Yield the offset of every line in *text* that starts with ``#``."""
+    if text.startswith("#"):
+        yield 0
+    i = text.find("\n#")
+    while i >= 0:
+        yield i + 1
+        i = text.find("\n#", i + 1)
+
+
+def _parse_header(line: str) -> tuple[int, str] | None:
+    """Return (level, title) for a ``#`` or ``##`` header line, else None.
+
+    Equivalent to matching ``^#{1,2}\\s+(.+)``: the hashes must be followed by
+    whitespace and at least one more character.
+    """
+    rest = line.lstrip("#")
+    level = len(line) - len(rest)
+    if level > 2 or len(rest) < 2 or not rest[0].isspace():
+        return None
+    return level, rest.strip()
 
 
 def write_agents_md_section(existing: str, entries: list[tuple[str, str]]) -> str:
@@ -73,40 +97,53 @@ def write_agents_md_section(existing: str, entries: list[tuple[str, str]]) -> st
     Returns:
         Updated AGENTS.md content with managed section.
     """
-    managed_lines = [CTX_AGENTS_START, "", "## Team Context (synced by ctx)", ""]
-
-    for key, content in entries:
-        managed_lines.append(f"### {key}")
-        managed_lines.append(content.strip())
-        managed_lines.append("")
-
-    managed_lines.append(CTX_AGENTS_END)
-    managed_section = "\n".join(managed_lines)
+    parts = [CTX_AGENTS_START, "\n\n## Team Context (synced by ctx)\n\n"]
+    parts.extend(f"### {key}\n{content.strip()}\n\n" for key, content in entries)
+    parts.append(CTX_AGENTS_END)
+    managed_section = "".join(parts)
 
     # Replace existing managed section or append
-    clean = _strip_ctx_section(existing)
-    if clean.strip():
-        return clean.rstrip() + "\n\n" + managed_section + "\n"
-    else:
-        return managed_section + "\n"
+    clean = _strip_ctx_section(existing).rstrip()
+    if clean:
+        return clean + "\n\n" + managed_section + "\n"
+    return managed_section + "\n"
 
 
 def _strip_ctx_section(text: str) -> str:
     """Remove the ctx-managed section from text."""
-    if CTX_AGENTS_START not in text:
+    before, sep, rest = text.partition(CTX_AGENTS_START)
+    if not sep:
         return text
-    before = text[: text.index(CTX_AGENTS_START)]
-    if CTX_AGENTS_END in text:
-        after = text[text.index(CTX_AGENTS_END) + len(CTX_AGENTS_END) :]
-    else:
-        after = ""
-    return before + after
+    # Only an end marker after the start counts as closing the section
+    _, sep_end, after = rest.partition(CTX_AGENTS_END)
+    return before + (after if sep_end else "")
+
+
+class _SlugTable(dict):
+    """``str.translate`` table for slugs, filled in as characters are seen.
+
+    Word characters map to themselves, whitespace, underscores and dashes map
+    to a dash, and everything else is dropped -- the same classes as the
+    ``[^\\w\\s-]`` / ``[\\s_-]+`` regexes (``\\w`` is ``isalnum()`` plus ``_``).
+    """
+
+    def __missing__(self, codepoint: int) -> str | None:
+        ch = chr(codepoint)
+        if ch == "_" or ch == "-" or ch.isspace():
+            value = "-"
+        elif ch.isalnum():
+            value = ch
+        else:
+            value = None
+        self[codepoint] = value
+        return value
+
+
+_SLUG_TABLE = _SlugTable()
 
 
 def _slugify(text: str) -> str:
     """Convert text to a key-safe slug."""
-    text = text.lower().strip()
-    text = re.sub(r"[^\w\s-]", "", text)
-    text = re.sub(r"[\s_]+", "-", text)
-    text = re.sub(r"-+", "-", text).strip("-")
-    return text or "untitled"
+    # Splitting on dashes collapses runs and trims the ends in one pass
+    parts = text.lower().translate(_SLUG_TABLE).split("-")
+    return "-".join(p for p in parts if p) or "untitled"
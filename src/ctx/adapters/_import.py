@@ -0,0 +1,31 @@
+"""Store writes shared by adapter imports.
+
+Adapters collect ``{"type", "key", "source", "content"}`` item dicts from
+their tool's files; ``write_import_items`` turns them into store entries.
+"""
+
+from __future__ import annotations
+
+from ctx.core.store import ContextStore
+from ctx.utils.paths import get_author
+
+
+def write_import_items(store: ContextStore, items: list[dict], tool: str) -> int:
+    """Write skill and knowledge *items* to *store*, returning how many were written.
+
+    Entries are attributed to ``import:<tool> (<user@machine>)``. Knowledge
+    entries share an author sidecar, so they are written in one
+    ``set_knowledge_many`` batch. Items of any other type are skipped.
+    """
+    author = f"import:{tool} ({get_author()})"
+    knowledge: list[tuple[str, str]] = []
+    imported = 0
+    for item in items:
+        if item["type"] == "skill":
+            store.set_skill(item["key"], item["content"], agent=author)
+            imported += 1
+        elif item["type"] == "knowledge":
+            knowledge.append((item["key"], item["content"]))
+            imported += 1
+    store.set_knowledge_many(knowledge, author=author)
+    return imported
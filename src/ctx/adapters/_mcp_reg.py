@@ -6,6 +6,8 @@ import json
 import logging
 from pathlib import Path
 
+from ctx.utils.paths import atomic_write_text
+
 logger = logging.getLogger(__name__)
 
 SERVER_NAME = "context-teleport"
@@ -38,11 +40,18 @@ def _server_entry(caller_name: str = "", local: bool = False) -> dict:
 
 def _safe_read_json(path: Path) -> dict:
     """Read a JSON file, returning empty dict on any error."""
-    if not path.is_file():
+    try:
+        raw = path.read_bytes()
+    except (FileNotFoundError, NotADirectoryError, IsADirectoryError):
+        # No config file yet: nothing to warn about
+        return {}
+    except OSError as exc:
+        logger.warning("Failed to read MCP config %s: %s", path, exc)
         return {}
     try:
-        return json.loads(path.read_text())
-    except (json.JSONDecodeError, OSError) as exc:
+        # json.loads detects the UTF encoding itself, no str round trip needed
+        return json.loads(raw)
+    except (json.JSONDecodeError, UnicodeDecodeError) as exc:
         logger.warning("Failed to parse MCP config %s: %s", path, exc)
         return {}
 
@@ -62,9 +71,12 @@ def register_mcp_json(
     config = _safe_read_json(config_path)
     if "mcpServers" not in config:
         config["mcpServers"] = {}
-    config["mcpServers"][server_name] = _server_entry(caller_name, local=local)
-    config_path.parent.mkdir(parents=True, exist_ok=True)
-    config_path.write_text(json.dumps(config, indent=2) + "\n")
+    entry = _server_entry(caller_name, local=local)
+    # Already registered as-is: leave the user's file (and its mtime) alone
+    if config["mcpServers"].get(server_name) != entry:
+        config["mcpServers"][server_name] = entry
+        config_path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_text(config_path, json.dumps(config, indent=2) + "\n")
     return {
         "status": "registered",
         "path": str(config_path),
@@ -80,7 +92,7 @@ def unregister_mcp_json(config_path: Path, server_name: str = SERVER_NAME) -> di
         return {"status": "not_registered"}
     del servers[server_name]
     config["mcpServers"] = servers
-    config_path.write_text(json.dumps(config, indent=2) + "\n")
+    atomic_write_text(config_path, json.dumps(config, indent=2) + "\n")
     return {
         "status": "unregistered",
         "path": str(config_path),
@@ -129,9 +141,11 @@ def register_mcp_opencode(
     config = _safe_read_json(config_path)
     if "mcp" not in config:
         config["mcp"] = {}
-    config["mcp"][server_name] = _opencode_server_entry(caller_name, local=local)
-    config_path.parent.mkdir(parents=True, exist_ok=True)
-    config_path.write_text(json.dumps(config, indent=2) + "\n")
+    entry = _opencode_server_entry(caller_name, local=local)
+    if config["mcp"].get(server_name) != entry:
+        config["mcp"][server_name] = entry
+        config_path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_text(config_path, json.dumps(config, indent=2) + "\n")
     return {
         "status": "registered",
         "path": str(config_path),
@@ -149,7 +163,7 @@ def unregister_mcp_opencode(
         return {"status": "not_registered"}
     del servers[server_name]
     config["mcp"] = servers
-    config_path.write_text(json.dumps(config, indent=2) + "\n")
+    atomic_write_text(config_path, json.dumps(config, indent=2) + "\n")
     return {
         "status": "unregistered",
         "path": str(config_path),
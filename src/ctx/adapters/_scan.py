@@ -0,0 +1,138 @@
+"""Shared file scanning, reading and writing helpers for adapters.
+
+Thin ``os`` wrappers for the layouts adapters read and write: flat rule
+directories and one-directory-per-skill trees. Listings are sorted by name
+and missing directories yield an empty list.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Shared with the store, which must not depend on the adapters package
+from ctx.utils.paths import scan_skill_files  # noqa: F401
+
+# Below this many files a thread pool costs more than it overlaps
+_PARALLEL_READ_MIN = 5
+_READ_WORKERS = 8
+# From this size on, decoding a read-only mmap beats copying through os.read
+_MMAP_READ_MIN = 1 << 17
+
+
+def scan_files(directory: Path, suffix: str) -> list[Path]:
+    """Return regular files in *directory* whose name ends with *suffix*."""
+    try:
+        with os.scandir(directory) as it:
+            names = [e.name for e in it if e.name.endswith(suffix) and e.is_file()]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+    names.sort()
+    return [directory / name for name in names]
+
+
+def ensure_subdirs(parent: Path, names: Iterable[str]) -> set[str]:
+    """Create ``<parent>/<name>`` for each name that does not exist yet.
+
+    Lists *parent* once instead of probing every child with
+    ``mkdir(exist_ok=True)``. Returns the names that were created (and so
+    are known to be empty).
+    """
+    parent.mkdir(parents=True, exist_ok=True)
+    with os.scandir(parent) as it:
+        existing = {e.name for e in it if e.is_dir()}
+    created: set[str] = set()
+    for name in names:
+        if name not in existing and name not in created:
+            os.mkdir(parent / name)
+            created.add(name)
+    return created
+
+
+def read_file(path: Path) -> str:
+    """Read a UTF-8 text file with a single sized read.
+
+    Equivalent to ``path.read_text()`` (including universal newline
+    translation) but sizes the read from ``fstat`` instead of going through
+    the buffered text layer, which is markedly faster for small files.
+    Large files (some skills embed whole prompts) are memory-mapped and
+    decoded in place instead.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        if size >= _MMAP_READ_MIN:
+            # Decode straight from the page cache, skipping the bytes copy
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                text = str(mm, "utf-8")
+            return _normalize_newlines(text)
+        data = os.read(fd, size + 1)
+        # The file grew after fstat (or reported size 0): read to EOF
+        while len(data) > size:
+            chunk = os.read(fd, 1 << 16)
+            if not chunk:
+                break
+            data += chunk
+    finally:
+        os.close(fd)
+    return _normalize_newlines(data.decode("utf-8"))
+
+
+def _normalize_newlines(text: str) -> str:
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def read_file_if_exists(path: Path) -> str | None:
+    """``read_file``, returning None when *path* is not a readable regular file.
+
+    Lets callers open directly instead of probing with ``is_file()`` first.
+    """
+    try:
+        return read_file(path)
+    except (FileNotFoundError, NotADirectoryError, IsADirectoryError):
+        return None
+
+
+def write_file(path: Path, text: str) -> None:
+    """Write *text* to *path* as UTF-8, the counterpart of ``read_file``.
+
+    Equivalent to ``path.write_text(text)`` on POSIX, but encodes once and
+    writes through the raw file descriptor instead of a ``TextIOWrapper``.
+    """
+    data = memoryview(text.encode("utf-8"))
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        # os.write may write less than asked for large payloads
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+
+def fingerprint(paths: list[Path]) -> list[list]:
+    """Return ``[path, mtime_ns, size]`` for each existing path, in order.
+
+    A cheap stat-only snapshot: equal fingerprints mean none of the files
+    was added, removed or rewritten in between.
+    """
+    result = []
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        result.append([str(path), st.st_mtime_ns, st.st_size])
+    return result
+
+
+def read_texts(paths: list[Path]) -> list[str]:
+    """Read each path's text, in order, in parallel for larger batches."""
+    if len(paths) < _PARALLEL_READ_MIN:
+        return [read_file(p) for p in paths]
+    with ThreadPoolExecutor(max_workers=_READ_WORKERS) as pool:
+        return list(pool.map(read_file, paths))
@@ -5,6 +5,10 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Protocol, runtime_checkable
 
+# Knowledge key the Claude Code adapter imports CLAUDE.md under. Adapters
+# never export it, so CLAUDE.md is not copied into other tools' files.
+PROJECT_INSTRUCTIONS_KEY = "project-instructions"
+
 
 @runtime_checkable
 class AdapterProtocol(Protocol):
@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 import json
+import os
+import posixpath
+import re
 import shutil
 import tarfile
 import tempfile
@@ -12,49 +15,87 @@ from ctx.core.migrations import SCHEMA_VERSION, check_version_compatible
 from ctx.core.store import ContextStore
 from ctx.utils.paths import STORE_DIR
 
+_STREAM_BUFSIZE = 1 << 16
+
+# Bundles are mostly small text files: the fastest deflate level costs little
+# size and is valid for both stdlib gzip (0-9) and ISA-L igzip (0-3).
+_COMPRESS_LEVEL = 1
+
+# Session records are serialized with "id" as the first key; matching it
+# lets incoming records that are already present be skipped undecoded.
+_SESSION_ID_RE = re.compile(r'^\{\s*"id"\s*:\s*"([^"\\]*)"')
+
 
 class UnsafeBundleError(ValueError):
     """Raised when a bundle archive contains unsafe members (path traversal, symlinks)."""
 
 
-def _safe_extractall(tar: tarfile.TarFile, dest: Path) -> None:
-    """Extract tar members after validating against path traversal and symlinks.
+def _gzip_open(path: Path, mode: str, compresslevel: int = _COMPRESS_LEVEL):
+    """Open a gzip stream, using ISA-L's accelerated igzip when it is installed.
+
+    ``isal`` is an optional dependency (``pip install context-teleport[fast]``);
+    the stdlib gzip module produces and reads the same format.
+    """
+    try:
+        from isal import igzip as gzip_impl
+    except ImportError:
+        import gzip as gzip_impl
+    return gzip_impl.open(path, mode, compresslevel=compresslevel)
+
+
+def _check_member(member: tarfile.TarInfo) -> None:
+    """Reject bundle members that are links, absolute paths or '..' traversals."""
+    # Reject symlinks and hardlinks
+    if member.issym() or member.islnk():
+        raise UnsafeBundleError(
+            f"Refusing to extract link in bundle: {member.name}"
+        )
+
+    # Reject absolute paths
+    if member.name.startswith("/"):
+        raise UnsafeBundleError(
+            f"Refusing to extract absolute path in bundle: {member.name}"
+        )
+
+    # Reject '..' traversal (tar member names always use '/' separators)
+    if ".." in member.name.split("/"):
+        raise UnsafeBundleError(
+            f"Refusing to extract path traversal in bundle: {member.name}"
+        )
+
+
+def _bundle_member_filter(member: tarfile.TarInfo, dest_path: str) -> tarfile.TarInfo:
+    """Tar extraction filter rejecting unsafe bundle members.
 
     Rejects:
     - Members with absolute paths
     - Members with '..' path components
     - Symlinks and hardlinks (bundles should only contain regular files/dirs)
-    - Any member whose resolved path escapes the destination directory
+    - Any member whose normalized path escapes the destination directory
+
+    Accepted members are passed through the stdlib ``data`` filter (PEP 706).
     """
-    dest = dest.resolve()
-    for member in tar.getmembers():
-        # Reject symlinks and hardlinks
-        if member.issym() or member.islnk():
-            raise UnsafeBundleError(
-                f"Refusing to extract link in bundle: {member.name}"
-            )
-
-        # Reject absolute paths
-        if member.name.startswith("/"):
-            raise UnsafeBundleError(
-                f"Refusing to extract absolute path in bundle: {member.name}"
-            )
-
-        # Reject '..' traversal
-        if ".." in Path(member.name).parts:
-            raise UnsafeBundleError(
-                f"Refusing to extract path traversal in bundle: {member.name}"
-            )
-
-        # Final check: resolved path must stay within dest
-        target = (dest / member.name).resolve()
-        if not target.is_relative_to(dest):
-            raise UnsafeBundleError(
-                f"Refusing to extract member that escapes destination: {member.name}"
-            )
-
-    # All members validated, extract
-    tar.extractall(dest, filter="data")
+    _check_member(member)
+
+    # Final check: normalized path must stay within dest. This is textual;
+    # links are rejected above and data_filter re-checks with realpath.
+    target = os.path.normpath(os.path.join(dest_path, member.name))
+    if target != dest_path and not target.startswith(dest_path + os.sep):
+        raise UnsafeBundleError(
+            f"Refusing to extract member that escapes destination: {member.name}"
+        )
+
+    return tarfile.data_filter(member, dest_path)
+
+
+def _safe_extractall(tar: tarfile.TarFile, dest: Path) -> None:
+    """Extract tar members, validating each one as it is streamed out.
+
+    Validation happens in the extraction filter, so the archive is walked
+    once. Callers extract into a scratch directory, which makes a partial
+    extraction before an unsafe member is rejected harmless.
+    """
+    tar.extractall(str(dest.resolve()), filter=_bundle_member_filter)
 
 
 def export_bundle(store: ContextStore, output_path: Path, *, dry_run: bool = False) -> dict:
@@ -68,13 +109,11 @@ def export_bundle(store: ContextStore, output_path: Path, *, dry_run: bool = Fal
 
     if dry_run:
         # Collect what would be packaged
-        items = []
-        for f in sorted(store.store_dir.rglob("*")):
-            if f.is_file():
-                items.append({
-                    "target": str(f.relative_to(store.root)),
-                    "description": f"bundle {f.name}",
-                })
+        files = sorted(f for f in store.store_dir.rglob("*") if f.is_file())
+        items = [
+            {"target": str(f.relative_to(store.root)), "description": f"bundle {f.name}"}
+            for f in files
+        ]
         return {
             "path": str(output_path),
             "project": manifest.project.name,
@@ -82,7 +121,11 @@ def export_bundle(store: ContextStore, output_path: Path, *, dry_run: bool = Fal
             "items": items,
         }
 
-    with tarfile.open(output_path, "w:gz") as tar:
+    # Stream mode writes compressed blocks straight to disk without seeking
+    with (
+        _gzip_open(output_path, "wb") as gz,
+        tarfile.open(fileobj=gz, mode="w|", bufsize=_STREAM_BUFSIZE) as tar,
+    ):
         tar.add(store.store_dir, arcname=STORE_DIR)
 
     return {
@@ -92,15 +135,68 @@ def export_bundle(store: ContextStore, output_path: Path, *, dry_run: bool = Fal
     }
 
 
+def _check_bundle_version(bundle_manifest: dict) -> None:
+    bundle_version = bundle_manifest.get("schema_version", "0.1.0")
+    if not check_version_compatible(bundle_version):
+        raise ValueError(
+            f"Incompatible bundle version {bundle_version} "
+            f"(current: {SCHEMA_VERSION}). No migration path available."
+        )
+
+
+def _preview_bundle(bundle_path: Path) -> dict:
+    """Report what a bundle would import by reading member names, without extracting."""
+    knowledge_prefix = f"{STORE_DIR}/knowledge/"
+    decisions_prefix = f"{STORE_DIR}/knowledge/decisions/"
+    knowledge: list[dict] = []
+    decisions: list[dict] = []
+    has_store = False
+    has_sessions = False
+    manifest_data: bytes | None = None
+
+    with _gzip_open(bundle_path, "rb") as gz, tarfile.open(fileobj=gz, mode="r|") as tar:
+        for member in tar:
+            _check_member(member)
+            name = posixpath.normpath(member.name)
+            if name == STORE_DIR or name.startswith(f"{STORE_DIR}/"):
+                has_store = True
+            if not member.isfile():
+                continue
+            if name == f"{STORE_DIR}/manifest.json":
+                manifest_data = tar.extractfile(member).read()
+            elif name == f"{STORE_DIR}/history/sessions.ndjson":
+                has_sessions = True
+            elif name.endswith(".md"):
+                parent, _, filename = name.rpartition("/")
+                key = filename[: -len(".md")]
+                if parent + "/" == knowledge_prefix:
+                    knowledge.append({"type": "knowledge", "key": key, "source": filename})
+                elif parent + "/" == decisions_prefix:
+                    decisions.append({"type": "decision", "key": key, "source": filename})
+
+    if not has_store:
+        raise ValueError("Invalid bundle: no .context-teleport directory found")
+    if manifest_data is not None:
+        _check_bundle_version(json.loads(manifest_data))
+
+    items = knowledge + decisions
+    if has_sessions:
+        items.append({"type": "sessions", "key": "sessions.ndjson", "source": "history"})
+    return {"items": items, "imported": 0, "dry_run": True, "source": str(bundle_path)}
+
+
 def import_bundle(store: ContextStore, bundle_path: Path, *, dry_run: bool = False) -> dict:
     """Import a .ctxbundle archive into the store."""
     if not bundle_path.is_file():
         raise FileNotFoundError(f"Bundle not found: {bundle_path}")
 
+    if dry_run:
+        return _preview_bundle(bundle_path)
+
     imported = 0
 
     with tempfile.TemporaryDirectory() as tmpdir:
-        with tarfile.open(bundle_path, "r:gz") as tar:
+        with _gzip_open(bundle_path, "rb") as gz, tarfile.open(fileobj=gz, mode="r|") as tar:
             _safe_extractall(tar, Path(tmpdir))
 
         extracted_store = Path(tmpdir) / STORE_DIR
@@ -110,29 +206,7 @@ def import_bundle(store: ContextStore, bundle_path: Path, *, dry_run: bool = Fal
         # Check bundle version compatibility
         manifest_path = extracted_store / "manifest.json"
         if manifest_path.is_file():
-            bundle_manifest = json.loads(manifest_path.read_text())
-            bundle_version = bundle_manifest.get("schema_version", "0.1.0")
-            if not check_version_compatible(bundle_version):
-                raise ValueError(
-                    f"Incompatible bundle version {bundle_version} "
-                    f"(current: {SCHEMA_VERSION}). No migration path available."
-                )
-
-        # Dry run: report what would be imported without writing
-        if dry_run:
-            items = []
-            knowledge_dir = extracted_store / "knowledge"
-            if knowledge_dir.is_dir():
-                for f in knowledge_dir.glob("*.md"):
-                    items.append({"type": "knowledge", "key": f.stem, "source": f.name})
-            decisions_dir = extracted_store / "knowledge" / "decisions"
-            if decisions_dir.is_dir():
-                for f in decisions_dir.glob("*.md"):
-                    items.append({"type": "decision", "key": f.stem, "source": f.name})
-            sessions_file = extracted_store / "history" / "sessions.ndjson"
-            if sessions_file.is_file():
-                items.append({"type": "sessions", "key": "sessions.ndjson", "source": "history"})
-            return {"items": items, "imported": 0, "dry_run": True, "source": str(bundle_path)}
+            _check_bundle_version(json.loads(manifest_path.read_text()))
 
         # If store not initialized, copy wholesale
         if not store.initialized:
@@ -142,17 +216,19 @@ def import_bundle(store: ContextStore, bundle_path: Path, *, dry_run: bool = Fal
         # Otherwise merge knowledge and decisions
         knowledge_dir = extracted_store / "knowledge"
         if knowledge_dir.is_dir():
+            store_knowledge_dir = store.knowledge_dir()
             for f in knowledge_dir.glob("*.md"):
-                target = store.knowledge_dir() / f.name
-                target.write_text(f.read_text())
+                target = store_knowledge_dir / f.name
+                shutil.copyfile(f, target)
                 imported += 1
 
         decisions_dir = extracted_store / "knowledge" / "decisions"
         if decisions_dir.is_dir():
+            store_decisions_dir = store.decisions_dir()
             for f in decisions_dir.glob("*.md"):
-                target = store.decisions_dir() / f.name
+                target = store_decisions_dir / f.name
                 if not target.exists():
-                    target.write_text(f.read_text())
+                    shutil.copyfile(f, target)
                     imported += 1
 
         # Merge sessions
@@ -161,23 +237,31 @@ def import_bundle(store: ContextStore, bundle_path: Path, *, dry_run: bool = Fal
             existing_path = store.store_dir / "history" / "sessions.ndjson"
             existing_ids = set()
             if existing_path.is_file():
-                for line in existing_path.read_text().strip().split("\n"):
-                    if line.strip():
+                # Existing records are read once per merge: decode them fully
+                # so that corrupt lines never count as present
+                with open(existing_path) as f:
+                    for line in f:
+                        if not line.strip():
+                            continue
                         try:
-                            obj = json.loads(line)
-                            existing_ids.add(obj.get("id", ""))
+                            existing_ids.add(json.loads(line).get("id", ""))
                         except json.JSONDecodeError:
                             pass
 
-            with open(existing_path, "a") as out:
-                for line in sessions_file.read_text().strip().split("\n"):
-                    if line.strip():
-                        try:
-                            obj = json.loads(line)
-                            if obj.get("id", "") not in existing_ids:
-                                out.write(line + "\n")
-                                imported += 1
-                        except json.JSONDecodeError:
-                            pass
+            with open(sessions_file) as src, open(existing_path, "a") as out:
+                for line in src:
+                    line = line.rstrip("\n")
+                    if not line.strip():
+                        continue
+                    match = _SESSION_ID_RE.match(line)
+                    if match and match.group(1) in existing_ids:
+                        continue
+                    try:
+                        obj = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if obj.get("id", "") not in existing_ids:
+                        out.write(line + "\n")
+                        imported += 1
 
     return {"imported": imported, "source": str(bundle_path)}
@@ -2,16 +2,29 @@
 
 from __future__ import annotations
 
+import io
 import json
 import logging
 import re
-import shutil
+from collections.abc import Iterator
 from pathlib import Path
 
+from ctx import __version__
+from ctx.adapters._agents_md import _slugify
 from ctx.adapters._mcp_reg import register_mcp_json, unregister_mcp_json
-from ctx.core.scope import Scope
+from ctx.adapters._scan import (
+    ensure_subdirs,
+    fingerprint,
+    read_file_if_exists,
+    read_texts,
+    scan_files,
+    scan_skill_files,
+)
+from ctx.adapters.base import PROJECT_INSTRUCTIONS_KEY
+from ctx.core.scope import SCOPE_FILENAME, Scope
 from ctx.core.store import ContextStore
 from ctx.utils.paths import (
+    atomic_write_text,
     claude_home,
     find_claude_project_dir,
     get_author,
@@ -22,6 +35,70 @@ logger = logging.getLogger(__name__)
 
 CTX_SECTION_MARKER = "## Team Context (managed by ctx)"
 CTX_SECTION_END = "<!-- end ctx managed -->"
+CTX_MEMORY_HEADER = "# Team Context (synced by ctx)"
+
+# Matches # and ## headers (### and deeper are nested content). Whitespace
+# after the hashes must not span a newline.
+_RE_HEADER = re.compile(r"^(#{1,2})[^\S\n]+(.+)", re.MULTILINE)
+
+_UNSET = object()
+
+# Claude Code lifecycle hooks installed into .claude/settings.json. Built
+# once at import; callers only read it.
+_HOOKS_CONFIG: dict[str, list[dict]] = {
+    # PreCompact: save state before compaction loses context
+    "PreCompact": [
+        {
+            "matcher": "manual|auto",
+            "hooks": [
+                {
+                    "type": "command",
+                    "command": (
+                        'echo "Context Teleport: saving state before compaction. '
+                        "Use context_onboarding prompt or context_search tool "
+                        'to recover project context after compaction."'
+                    ),
+                },
+            ],
+        },
+    ],
+    # SessionStart (compact): remind agent to re-orient after compaction
+    "SessionStart": [
+        {
+            "matcher": "compact",
+            "hooks": [
+                {
+                    "type": "command",
+                    "command": (
+                        'echo "Context was just compacted. '
+                        "Use the context_onboarding prompt from context-teleport MCP server "
+                        "to reload full project context including knowledge, conventions, "
+                        'decisions, skills, and team activity."'
+                    ),
+                },
+            ],
+        },
+    ],
+    # SubagentStart: inject context awareness into subagents
+    "SubagentStart": [
+        {
+            "matcher": "",
+            "hooks": [
+                {
+                    "type": "command",
+                    "command": (
+                        'echo "This project uses context-teleport for shared context. '
+                        "The context-teleport MCP server provides project knowledge, "
+                        "conventions, decisions, and skills. Use context_search to find "
+                        'relevant context before starting work."'
+                    ),
+                },
+            ],
+        },
+    ],
+}
+# Ordered like _HOOKS_CONFIG so uninstall reports removals deterministically
+_MANAGED_HOOK_EVENTS = tuple(_HOOKS_CONFIG)
 
 
 class ClaudeCodeAdapter:
@@ -31,19 +108,21 @@ class ClaudeCodeAdapter:
 
     def __init__(self, store: ContextStore) -> None:
         self.store = store
+        self._project_dir: Path | None | object = _UNSET
 
     def detect(self) -> bool:
-        """Check if Claude Code is installed."""
-        home = claude_home()
-        if not home.is_dir():
-            return False
-        # Check for claude binary
-        if shutil.which("claude") is not None:
-            return True
-        return home.is_dir()
+        """Check if Claude Code is installed.
+
+        The ~/.claude home directory is required and sufficient: the claude
+        binary alone (without a home directory) does not count.
+        """
+        return claude_home().is_dir()
 
     def _find_project_dir(self) -> Path | None:
-        return find_claude_project_dir(self.store.root)
+        """Return the Claude Code project directory, looked up once per adapter."""
+        if self._project_dir is _UNSET:
+            self._project_dir = find_claude_project_dir(self.store.root)
+        return self._project_dir
 
     def _read_memory_md(self) -> str | None:
         """Read MEMORY.md from Claude Code project directory."""
@@ -52,40 +131,77 @@ class ClaudeCodeAdapter:
             logger.warning("No Claude Code project memory directory found for %s", self.store.root)
             return None
         memory_dir = project_dir / "memory"
-        if not memory_dir.is_dir():
+        text = read_file_if_exists(memory_dir / "MEMORY.md")
+        if text is None and not memory_dir.is_dir():
             logger.warning("Claude Code memory directory missing: %s", memory_dir)
-            return None
-        memory_file = memory_dir / "MEMORY.md"
-        if memory_file.is_file():
-            return memory_file.read_text()
-        return None
+        return text
 
     def _read_claude_md(self) -> str | None:
         """Read project CLAUDE.md."""
-        claude_md = self.store.root / "CLAUDE.md"
-        if claude_md.is_file():
-            return claude_md.read_text()
-        return None
-
-    def _read_rules(self) -> list[tuple[str, str]]:
-        """Read .claude/rules/*.md files."""
-        rules_dir = self.store.root / ".claude" / "rules"
-        if not rules_dir.is_dir():
-            return []
-        result = []
-        for f in sorted(rules_dir.glob("*.md")):
-            result.append((f.stem, f.read_text()))
-        return result
+        return read_file_if_exists(self.store.root / "CLAUDE.md")
+
+    def _source_files(self) -> tuple[list[Path], list[Path]]:
+        """List .claude/rules/*.md and .claude/skills/*/SKILL.md files."""
+        claude_dir = self.store.root / ".claude"
+        return scan_files(claude_dir / "rules", ".md"), scan_skill_files(claude_dir / "skills")
+
+    def _read_rules(self, files: list[Path] | None = None) -> list[tuple[str, str]]:
+        """Read .claude/rules/*.md files (pre-scanned *files* if given)."""
+        if files is None:
+            files = self._source_files()[0]
+        return [(f.stem, text) for f, text in zip(files, read_texts(files))]
+
+    def _read_skills(self, files: list[Path] | None = None) -> list[tuple[str, str]]:
+        """Read .claude/skills/*/SKILL.md files (pre-scanned *files* if given)."""
+        if files is None:
+            files = self._source_files()[1]
+        return [(f.parent.name, text) for f, text in zip(files, read_texts(files))]
+
+    def _source_fingerprint(self, rule_files: list[Path], skill_files: list[Path]) -> list[list]:
+        """Stat snapshot of every file an import reads from."""
+        paths = [self.store.root / "CLAUDE.md"]
+        project_dir = self._find_project_dir()
+        if project_dir is not None:
+            paths.append(project_dir / "memory" / "MEMORY.md")
+        return fingerprint(paths + rule_files + skill_files)
 
-    def _read_skills(self) -> list[tuple[str, str]]:
-        """Read .claude/skills/*/SKILL.md files."""
-        skills_dir = self.store.root / ".claude" / "skills"
-        if not skills_dir.is_dir():
-            return []
-        result = []
-        for skill_md in sorted(skills_dir.glob("*/SKILL.md")):
-            result.append((skill_md.parent.name, skill_md.read_text()))
-        return result
+    def _store_fingerprint(self) -> list[list]:
+        """Stat snapshot of the store files an import writes to.
+
+        Included so that local edits or deletions in the store force a
+        fresh import.
+        """
+        paths = scan_files(self.store.knowledge_dir(), ".md")
+        paths += scan_skill_files(self.store.skills_dir())
+        return fingerprint(paths)
+
+    def _export_store_fingerprint(self) -> list[list]:
+        """Stat snapshot of the store files an export renders.
+
+        Led by the ctx version, so an upgrade that renders CLAUDE.md or
+        MEMORY.md differently re-exports stores that have not changed.
+        """
+        store = self.store
+        paths: list[Path] = []
+        for directory in (store.conventions_dir(), store.knowledge_dir(), store.decisions_dir()):
+            paths += scan_files(directory, ".md")
+            paths.append(directory / SCOPE_FILENAME)
+        paths += scan_skill_files(store.skills_dir())
+        paths.append(store.skills_dir() / SCOPE_FILENAME)
+        return [["ctx", __version__], *fingerprint(paths)]
+
+    def _export_target_fingerprint(self) -> list[list]:
+        """Stat snapshot of the files an export writes.
+
+        Included so that hand edits (or deletions) of CLAUDE.md, MEMORY.md
+        or an exported skill force a fresh export.
+        """
+        paths = [self.store.root / "CLAUDE.md"]
+        project_dir = self._find_project_dir()
+        if project_dir is not None:
+            paths.append(project_dir / "memory" / "MEMORY.md")
+        paths += scan_skill_files(self.store.root / ".claude" / "skills")
+        return fingerprint(paths)
 
     def _parse_memory_into_knowledge(self, memory_text: str) -> list[tuple[str, str]]:
         """Parse MEMORY.md content into knowledge entries.
@@ -95,104 +211,117 @@ class ClaudeCodeAdapter:
         If no ## headers found, tries # headers.
         If no headers at all, stores as a single 'memory' entry.
         """
-        sections: list[tuple[str, str]] = []
-        current_key = ""
-        current_lines: list[str] = []
-
-        for line in memory_text.split("\n"):
-            # Match ## headers as section boundaries (### and #### are nested content)
-            header_match = re.match(r"^(#{1,2})\s+(.+)", line)
-            if header_match and len(header_match.group(1)) <= 2:
-                if current_key and current_lines:
-                    sections.append((current_key, "\n".join(current_lines).strip()))
-                raw = header_match.group(2).strip()
-                current_key = _slugify(raw)
-                current_lines = [line]
-            else:
-                current_lines.append(line)
-
-        if current_key and current_lines:
-            sections.append((current_key, "\n".join(current_lines).strip()))
+        # Section bodies are sliced from the original text between header
+        # matches; content before the first header is dropped. A slice
+        # always starts at its header, so only trailing whitespace is trimmed.
+        matches = list(_RE_HEADER.finditer(memory_text))
+        ends = [m.start() for m in matches[1:]]
+        ends.append(len(memory_text))
+        sections: list[tuple[str, str]] = [
+            (_slugify(match.group(2).strip()), memory_text[match.start() : end].rstrip())
+            for match, end in zip(matches, ends)
+        ]
 
         if not sections and memory_text.strip():
             sections.append(("memory", memory_text.strip()))
 
         return sections
 
-    def import_context(self, dry_run: bool = False) -> dict:
-        """Extract from Claude Code internals into the context store."""
-        items: list[dict] = []
-
+    def _iter_import_items(
+        self, rule_files: list[Path] | None = None, skill_files: list[Path] | None = None
+    ) -> Iterator[dict]:
+        """Yield importable items, reading each source only when reached."""
         # Import MEMORY.md
         memory = self._read_memory_md()
         if memory:
-            entries = self._parse_memory_into_knowledge(memory)
-            for key, content in entries:
-                items.append({
+            for key, content in self._parse_memory_into_knowledge(memory):
+                yield {
                     "type": "knowledge",
                     "key": key,
                     "source": "MEMORY.md",
                     "content": content,
-                })
+                }
 
         # Import CLAUDE.md (as conventions/project-instructions)
         claude_md = self._read_claude_md()
         if claude_md:
             # Strip any existing ctx-managed section
-            clean = _strip_ctx_section(claude_md)
-            if clean.strip():
-                items.append({
+            clean = _strip_ctx_section(claude_md).strip()
+            if clean:
+                yield {
                     "type": "knowledge",
-                    "key": "project-instructions",
+                    "key": PROJECT_INSTRUCTIONS_KEY,
                     "source": "CLAUDE.md",
-                    "content": clean.strip(),
-                })
+                    "content": clean,
+                }
 
         # Import rules
-        rules = self._read_rules()
-        for rule_name, rule_content in rules:
-            items.append({
+        for rule_name, rule_content in self._read_rules(rule_files):
+            yield {
                 "type": "knowledge",
                 "key": f"rule-{rule_name}",
                 "source": f".claude/rules/{rule_name}.md",
                 "content": rule_content,
-            })
+            }
 
         # Import skills
-        skills = self._read_skills()
-        for skill_name, skill_content in skills:
-            items.append({
+        for skill_name, skill_content in self._read_skills(skill_files):
+            yield {
                 "type": "skill",
                 "key": skill_name,
                 "source": f".claude/skills/{skill_name}/SKILL.md",
                 "content": skill_content,
-            })
+            }
+
+    def import_context(self, dry_run: bool = False) -> dict:
+        """Extract from Claude Code internals into the context store."""
+        items: list[dict] = []
 
         if dry_run:
+            items.extend(self._iter_import_items())
             return {"items": items, "imported": 0, "dry_run": True}
 
-        # Write to store
-        imported = 0
-        for item in items:
+        # Sources are scanned and stat'ed once, before they are read, and
+        # the same listing drives both the fingerprint and the reads
+        rule_files, skill_files = self._source_files()
+        sources = self._source_fingerprint(rule_files, skill_files)
+
+        # Nothing changed on either side since the last import: skip the
+        # reads, parsing and store writes entirely
+        previous = self.store.read_import_fingerprint(self.name)
+        if previous is not None and previous == sources + self._store_fingerprint():
+            return {"items": items, "imported": 0, "dry_run": False, "cached": True}
+
+        # Skills are written as soon as they are read; knowledge entries
+        # share an author sidecar, so they are written in one batch
+        author = f"import:claude-code ({get_author()})"
+        knowledge: list[tuple[str, str]] = []
+        for item in self._iter_import_items(rule_files, skill_files):
             if item["type"] == "skill":
-                self.store.set_skill(
-                    item["key"],
-                    item["content"],
-                    agent=f"import:claude-code ({get_author()})",
-                )
+                self.store.set_skill(item["key"], item["content"], agent=author)
             else:
-                self.store.set_knowledge(
-                    item["key"],
-                    item["content"],
-                    author=f"import:claude-code ({get_author()})",
-                )
-            imported += 1
+                knowledge.append((item["key"], item["content"]))
+            items.append(item)
+        self.store.set_knowledge_many(knowledge, author=author)
+        imported = len(items)
 
+        self.store.write_import_fingerprint(self.name, sources + self._store_fingerprint())
         return {"items": items, "imported": imported, "dry_run": False}
 
     def export_context(self, dry_run: bool = False) -> dict:
         """Inject store content into Claude Code locations (public entries only)."""
         items: list[dict] = []
+
+        # Neither the store nor the exported files changed since the last
+        # export: skip listing, rendering and comparing entirely. The store
+        # is snapshotted before it is listed, so a write that lands while
+        # exporting is picked up by the next export rather than recorded.
+        if not dry_run:
+            store_state = self._export_store_fingerprint()
+            previous = self.store.read_export_fingerprint(self.name)
+            if previous is not None and previous == store_state + self._export_target_fingerprint():
+                return {"items": items, "exported": 0, "dry_run": False, "unchanged": True}
+
         conventions = self.store.list_conventions(scope=Scope.public)
         knowledge = self.store.list_knowledge(scope=Scope.public)
         decisions = self.store.list_decisions(scope=Scope.public)
@@ -201,57 +330,56 @@ class ClaudeCodeAdapter:
         if not conventions and not knowledge and not decisions and not skills:
             return {"items": [], "exported": 0, "dry_run": dry_run}
 
-        # Build the managed section for CLAUDE.md
-        section_lines = [CTX_SECTION_MARKER, ""]
+        # Entries that came from CLAUDE.md itself are not written back
+        exported_knowledge = [e for e in knowledge if e.key != PROJECT_INSTRUCTIONS_KEY]
+
+        # Build the CLAUDE.md managed section and MEMORY.md content in one
+        # pass: both list conventions, then knowledge, under different headers
+        section = io.StringIO()
+        memory = io.StringIO()
+        ws = section.write
+        wm = memory.write
+        ws(CTX_SECTION_MARKER)
+        ws("\n\n")
+        wm(CTX_MEMORY_HEADER)
+        wm("\n")
 
         if conventions:
-            section_lines.append("### Team Conventions")
-            section_lines.append("")
+            ws("### Team Conventions\n\n")
+            wm("\n## Team Conventions\n")
             for entry in conventions:
-                section_lines.append(f"#### {entry.key}")
-                section_lines.append(entry.content.strip())
-                section_lines.append("")
-
-        if knowledge:
-            for entry in knowledge:
-                # Skip entries that came from CLAUDE.md itself
-                if entry.key == "project-instructions":
-                    continue
-                section_lines.append(f"### {entry.key}")
-                section_lines.append(entry.content.strip())
-                section_lines.append("")
+                content = entry.content.strip()
+                ws(f"#### {entry.key}\n")
+                ws(content)
+                ws("\n\n")
+                wm(f"\n### {entry.key}\n")
+                wm(content)
+                wm("\n")
+
+        for entry in exported_knowledge:
+            content = entry.content.strip()
+            ws(f"### {entry.key}\n")
+            ws(content)
+            ws("\n\n")
+            wm(f"\n## {entry.key}\n")
+            wm(content)
+            wm("\n")
 
         if decisions:
-            section_lines.append("### Decisions")
+            ws("### Decisions\n")
             for d in decisions:
-                section_lines.append(f"- **{d.id:04d}** {d.title} ({d.status.value})")
-            section_lines.append("")
+                ws(f"- **{d.id:04d}** {d.title} ({d.status.value})\n")
+            ws("\n")
 
-        section_lines.append(CTX_SECTION_END)
-        managed_section = "\n".join(section_lines)
+        ws(CTX_SECTION_END)
+        managed_section = section.getvalue()
+        memory_content = memory.getvalue()
 
         items.append({
             "target": "CLAUDE.md",
-            "description": f"Managed section with {len(conventions)} conventions, {len(knowledge)} knowledge entries, {len(decisions)} decisions",
+            "description": f"Managed section with {len(conventions)} conventions, {len(exported_knowledge)} knowledge entries, {len(decisions)} decisions",
         })
 
-        # Build MEMORY.md content
-        memory_lines = ["# Team Context (synced by ctx)", ""]
-        if conventions:
-            memory_lines.append("## Team Conventions")
-            memory_lines.append("")
-            for entry in conventions:
-                memory_lines.append(f"### {entry.key}")
-                memory_lines.append(entry.content.strip())
-                memory_lines.append("")
-        for entry in knowledge:
-            if entry.key == "project-instructions":
-                continue
-            memory_lines.append(f"## {entry.key}")
-            memory_lines.append(entry.content.strip())
-            memory_lines.append("")
-        memory_content = "\n".join(memory_lines)
-
         project_dir = self._find_project_dir()
         if project_dir:
             items.append({
@@ -268,15 +396,18 @@ class ClaudeCodeAdapter:
         if dry_run:
             return {"items": items, "exported": 0, "dry_run": True}
 
-        # Write CLAUDE.md
+        # Write CLAUDE.md. Files whose content would not change are left
+        # untouched, so a repeated export costs reads only.
         exported = 0
         claude_md_path = self.store.root / "CLAUDE.md"
-        if claude_md_path.is_file():
-            existing = claude_md_path.read_text()
+        existing = read_file_if_exists(claude_md_path)
+        if existing is not None:
             clean = _strip_ctx_section(existing)
-            claude_md_path.write_text(clean.rstrip() + "\n\n" + managed_section + "\n")
+            claude_md = clean.rstrip() + "\n\n" + managed_section + "\n"
         else:
-            claude_md_path.write_text(managed_section + "\n")
+            claude_md = managed_section + "\n"
+        if claude_md != existing:
+            atomic_write_text(claude_md_path, claude_md)
         exported += 1
 
         # Write MEMORY.md
@@ -284,28 +415,35 @@ class ClaudeCodeAdapter:
             memory_dir = project_dir / "memory"
             memory_dir.mkdir(parents=True, exist_ok=True)
             memory_file = memory_dir / "MEMORY.md"
-            if memory_file.is_file():
-                existing_memory = memory_file.read_text()
+            existing_memory = read_file_if_exists(memory_file)
+            if existing_memory is not None:
                 # Append or replace team context section
-                if "# Team Context (synced by ctx)" in existing_memory:
+                head, sep, _ = existing_memory.partition(CTX_MEMORY_HEADER)
+                if sep:
                     # Replace everything from that header onward
-                    idx = existing_memory.index("# Team Context (synced by ctx)")
-                    memory_file.write_text(existing_memory[:idx] + memory_content)
+                    new_memory = head + memory_content
                 else:
-                    memory_file.write_text(existing_memory.rstrip() + "\n\n" + memory_content)
+                    new_memory = existing_memory.rstrip() + "\n\n" + memory_content
             else:
-                memory_file.write_text(memory_content)
+                new_memory = memory_content
+            if new_memory != existing_memory:
+                atomic_write_text(memory_file, new_memory)
             exported += 1
 
         # Write skills
         if skills:
             skills_dir = self.store.root / ".claude" / "skills"
+            created = ensure_subdirs(skills_dir, [skill.name for skill in skills])
             for skill in skills:
-                skill_out = skills_dir / skill.name
-                skill_out.mkdir(parents=True, exist_ok=True)
-                (skill_out / "SKILL.md").write_text(skill.content)
+                skill_md = skills_dir / skill.name / "SKILL.md"
+                # A freshly created directory has nothing to compare against
+                if skill.name in created or read_file_if_exists(skill_md) != skill.content:
+                    atomic_write_text(skill_md, skill.content)
                 exported += 1
 
+        self.store.write_export_fingerprint(
+            self.name, store_state + self._export_target_fingerprint()
+        )
         return {"items": items, "exported": exported, "dry_run": False}
 
     def mcp_config_path(self) -> Path:
@@ -341,69 +479,14 @@ class ClaudeCodeAdapter:
         return self.store.root / ".claude" / "settings.json"
 
     def _build_hooks_config(self) -> dict:
-        """Build the hooks configuration for Claude Code lifecycle events.
+        """Return the hooks configuration for Claude Code lifecycle events.
 
         Generates hooks for:
         - PreCompact: save active state before context compaction
         - SessionStart (compact): re-inject context after compaction
         - SubagentStart: inject project context into subagents
         """
-        hooks: dict[str, list[dict]] = {}
-
-        # PreCompact: save state before compaction loses context
-        hooks["PreCompact"] = [
-            {
-                "matcher": "manual|auto",
-                "hooks": [
-                    {
-                        "type": "command",
-                        "command": (
-                            'echo "Context Teleport: saving state before compaction. '
-                            "Use context_onboarding prompt or context_search tool "
-                            'to recover project context after compaction."'
-                        ),
-                    },
-                ],
-            },
-        ]
-
-        # SessionStart (compact): remind agent to re-orient after compaction
-        hooks["SessionStart"] = [
-            {
-                "matcher": "compact",
-                "hooks": [
-                    {
-                        "type": "command",
-                        "command": (
-                            'echo "Context was just compacted. '
-                            "Use the context_onboarding prompt from context-teleport MCP server "
-                            "to reload full project context including knowledge, conventions, "
-                            'decisions, skills, and team activity."'
-                        ),
-                    },
-                ],
-            },
-        ]
-
-        # SubagentStart: inject context awareness into subagents
-        hooks["SubagentStart"] = [
-            {
-                "matcher": "",
-                "hooks": [
-                    {
-                        "type": "command",
-                        "command": (
-                            'echo "This project uses context-teleport for shared context. '
-                            "The context-teleport MCP server provides project knowledge, "
-                            "conventions, decisions, and skills. Use context_search to find "
-                            'relevant context before starting work."'
-                        ),
-                    },
-                ],
-            },
-        ]
-
-        return hooks
+        return _HOOKS_CONFIG
 
     def install_hooks(self, dry_run: bool = False) -> dict:
         """Install Claude Code lifecycle hooks in .claude/settings.json.
@@ -423,12 +506,26 @@ class ClaudeCodeAdapter:
 
         # Read existing settings
         settings: dict = {}
-        if settings_path.is_file():
-            try:
-                settings = json.loads(settings_path.read_text())
-            except (json.JSONDecodeError, OSError) as exc:
-                logger.warning("Failed to parse %s, starting fresh: %s", settings_path, exc)
-                settings = {}
+        try:
+            settings = json.loads(settings_path.read_bytes())
+        except FileNotFoundError:
+            pass
+        except (json.JSONDecodeError, UnicodeDecodeError, OSError) as exc:
+            logger.warning("Failed to parse %s, starting fresh: %s", settings_path, exc)
+            settings = {}
+
+        result = {
+            "status": "installed",
+            "path": str(settings_path),
+            "hooks": list(hooks_config.keys()),
+        }
+
+        # Already installed exactly as configured: nothing to write
+        current = settings.get("hooks")
+        if isinstance(current, dict) and all(
+            current.get(event) == entries for event, entries in hooks_config.items()
+        ):
+            return result
 
         # Merge hooks: replace ctx-managed hooks, preserve others
         if "hooks" not in settings:
@@ -438,32 +535,25 @@ class ClaudeCodeAdapter:
             settings["hooks"][event] = entries
 
         settings_path.parent.mkdir(parents=True, exist_ok=True)
-        settings_path.write_text(json.dumps(settings, indent=2) + "\n")
+        atomic_write_text(settings_path, json.dumps(settings, indent=2) + "\n")
 
-        return {
-            "status": "installed",
-            "path": str(settings_path),
-            "hooks": list(hooks_config.keys()),
-        }
+        return result
 
     def uninstall_hooks(self) -> dict:
         """Remove ctx-installed hooks from .claude/settings.json."""
         settings_path = self._settings_path()
-        if not settings_path.is_file():
-            return {"status": "no_settings"}
-
+        # A missing file lands in the OSError branch, no is_file() probe needed
         try:
-            settings = json.loads(settings_path.read_text())
-        except (json.JSONDecodeError, OSError):
+            settings = json.loads(settings_path.read_bytes())
+        except (json.JSONDecodeError, UnicodeDecodeError, OSError):
             return {"status": "no_settings"}
 
         hooks = settings.get("hooks", {})
         if not hooks:
             return {"status": "no_hooks"}
 
-        managed_events = set(self._build_hooks_config().keys())
         removed = []
-        for event in managed_events:
+        for event in _MANAGED_HOOK_EVENTS:
             if event in hooks:
                 del hooks[event]
                 removed.append(event)
@@ -472,7 +562,7 @@ class ClaudeCodeAdapter:
             return {"status": "no_hooks"}
 
         settings["hooks"] = hooks
-        settings_path.write_text(json.dumps(settings, indent=2) + "\n")
+        atomic_write_text(settings_path, json.dumps(settings, indent=2) + "\n")
 
         return {
             "status": "uninstalled",
@@ -481,22 +571,11 @@ class ClaudeCodeAdapter:
         }
 
 
-def _slugify(text: str) -> str:
-    """Convert text to a filesystem-safe slug."""
-    text = text.lower().strip()
-    text = re.sub(r"[^\w\s-]", "", text)
-    text = re.sub(r"[\s_]+", "-", text)
-    text = re.sub(r"-+", "-", text).strip("-")
-    return text or "untitled"
-
-
 def _strip_ctx_section(text: str) -> str:
     """Remove the ctx-managed section from a file."""
-    if CTX_SECTION_MARKER not in text:
+    before, sep, rest = text.partition(CTX_SECTION_MARKER)
+    if not sep:
         return text
-    before = text[: text.index(CTX_SECTION_MARKER)]
-    if CTX_SECTION_END in text:
-        after = text[text.index(CTX_SECTION_END) + len(CTX_SECTION_END) :]
-    else:
-        after = ""
-    return before + after
+    # Only an end marker after the start counts as closing the section
+    _, sep_end, after = rest.partition(CTX_SECTION_END)
+    return before + (after if sep_end else "")
@@ -3,13 +3,21 @@
 from __future__ import annotations
 
 import logging
-import shutil
 from pathlib import Path
 
 from ctx.adapters._agents_md import parse_agents_md, write_agents_md_section
+from ctx.adapters._import import write_import_items
+from ctx.adapters._scan import (
+    ensure_subdirs,
+    read_file_if_exists,
+    read_texts,
+    scan_skill_files,
+    write_file,
+)
+from ctx.adapters.base import PROJECT_INSTRUCTIONS_KEY
 from ctx.core.scope import Scope
 from ctx.core.store import ContextStore
-from ctx.utils.paths import get_author
+from ctx.utils.paths import atomic_write_text, executable_on_path
 
 logger = logging.getLogger(__name__)
 
@@ -21,19 +29,18 @@ class CodexAdapter:
         self.store = store
 
     def detect(self) -> bool:
-        if shutil.which("codex") is not None:
-            return True
+        # The project-local marker is one stat; PATH is only walked without it
         if (self.store.root / ".codex").is_dir():
             return True
-        return False
+        return executable_on_path("codex")
 
     def import_context(self, dry_run: bool = False) -> dict:
         items: list[dict] = []
 
         # AGENTS.md
-        agents_md = self.store.root / "AGENTS.md"
-        if agents_md.is_file():
-            entries = parse_agents_md(agents_md.read_text())
+        agents_text = read_file_if_exists(self.store.root / "AGENTS.md")
+        if agents_text is not None:
+            entries = parse_agents_md(agents_text)
             for key, content in entries:
                 items.append({
                     "type": "knowledge",
@@ -43,51 +50,38 @@ class CodexAdapter:
                 })
 
         # .codex/instructions.md
-        instructions = self.store.root / ".codex" / "instructions.md"
-        if instructions.is_file():
+        instructions = read_file_if_exists(self.store.root / ".codex" / "instructions.md")
+        if instructions is not None:
             items.append({
                 "type": "knowledge",
                 "key": "codex-instructions",
                 "source": ".codex/instructions.md",
-                "content": instructions.read_text().strip(),
+                "content": instructions.strip(),
             })
 
         # .codex/skills/*/SKILL.md
-        skills_dir = self.store.root / ".codex" / "skills"
-        if skills_dir.is_dir():
-            for skill_md in sorted(skills_dir.glob("*/SKILL.md")):
-                items.append({
-                    "type": "skill",
-                    "key": skill_md.parent.name,
-                    "source": f".codex/skills/{skill_md.parent.name}/SKILL.md",
-                    "content": skill_md.read_text(),
-                })
+        skill_files = scan_skill_files(self.store.root / ".codex" / "skills")
+        for skill_md, content in zip(skill_files, read_texts(skill_files)):
+            items.append({
+                "type": "skill",
+                "key": skill_md.parent.name,
+                "source": f".codex/skills/{skill_md.parent.name}/SKILL.md",
+                "content": content,
+            })
 
         if dry_run:
             return {"items": items, "imported": 0, "dry_run": True}
 
-        imported = 0
-        for item in items:
-            if item["type"] == "skill":
-                self.store.set_skill(
-                    item["key"],
-                    item["content"],
-                    agent=f"import:codex ({get_author()})",
-                )
-            else:
-                self.store.set_knowledge(
-                    item["key"],
-                    item["content"],
-                    author=f"import:codex ({get_author()})",
-                )
-            imported += 1
-
+        imported = write_import_items(self.store, items, "codex")
         return {"items": items, "imported": imported, "dry_run": False}
 
     def export_context(self, dry_run: bool = False) -> dict:
         items: list[dict] = []
         conventions = self.store.list_conventions(scope=Scope.public)
-        knowledge = self.store.list_knowledge(scope=Scope.public)
+        knowledge = [
+            e for e in self.store.list_knowledge(scope=Scope.public)
+            if e.key != PROJECT_INSTRUCTIONS_KEY
+        ]
         skills = self.store.list_skills(scope=Scope.public)
 
         if not conventions and not knowledge and not skills:
@@ -112,22 +106,20 @@ class CodexAdapter:
 
         if conventions or knowledge:
             agents_md_path = self.store.root / "AGENTS.md"
-            existing = agents_md_path.read_text() if agents_md_path.is_file() else ""
-            entries: list[tuple[str, str]] = []
-            for e in conventions:
-                entries.append((f"convention: {e.key}", e.content))
-            for e in knowledge:
-                if e.key != "project-instructions":
-                    entries.append((e.key, e.content))
-            agents_md_path.write_text(write_agents_md_section(existing, entries))
+            existing = read_file_if_exists(agents_md_path) or ""
+            entries = [(f"convention: {e.key}", e.content) for e in conventions]
+            entries += [(e.key, e.content) for e in knowledge]
+            result = write_agents_md_section(existing, entries)
+            # Leave AGENTS.md (and its mtime) alone when nothing changed
+            if result != existing:
+                atomic_write_text(agents_md_path, result)
             exported += 1
 
         if skills:
             skills_dir = self.store.root / ".codex" / "skills"
+            ensure_subdirs(skills_dir, [skill.name for skill in skills])
             for skill in skills:
-                skill_out = skills_dir / skill.name
-                skill_out.mkdir(parents=True, exist_ok=True)
-                (skill_out / "SKILL.md").write_text(skill.content)
+                write_file(skills_dir / skill.name / "SKILL.md", skill.content)
                 exported += 1
 
         return {"items": items, "exported": exported, "dry_run": False}
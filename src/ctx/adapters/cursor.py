@@ -5,11 +5,20 @@ from __future__ import annotations
 import logging
 from pathlib import Path
 
+from ctx.adapters._import import write_import_items
 from ctx.adapters._mcp_reg import register_mcp_json, unregister_mcp_json
+from ctx.adapters._scan import (
+    ensure_subdirs,
+    read_file_if_exists,
+    read_texts,
+    scan_files,
+    scan_skill_files,
+    write_file,
+)
+from ctx.adapters.base import PROJECT_INSTRUCTIONS_KEY
 from ctx.core.frontmatter import build_frontmatter, parse_frontmatter
 from ctx.core.scope import Scope
 from ctx.core.store import ContextStore
-from ctx.utils.paths import get_author
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +26,10 @@ logger = logging.getLogger(__name__)
 parse_mdc = parse_frontmatter
 format_mdc = build_frontmatter
 
+# format_mdc output for the fixed {description, alwaysApply: true} metadata
+# every exported rule carries
+_MDC_RULE_TEMPLATE = "---\ndescription: {description}\nalwaysApply: true\n---\n\n{body}\n"
+
 
 class CursorAdapter:
     name = "cursor"
@@ -35,64 +48,50 @@ class CursorAdapter:
         items: list[dict] = []
 
         # .cursor/rules/*.mdc
-        rules_dir = self.store.root / ".cursor" / "rules"
-        if rules_dir.is_dir():
-            for f in sorted(rules_dir.glob("*.mdc")):
-                metadata, body = parse_mdc(f.read_text())
-                items.append({
-                    "type": "knowledge",
-                    "key": f"cursor-rule-{f.stem}",
-                    "source": f".cursor/rules/{f.name}",
-                    "content": body,
-                    "metadata": metadata,
-                })
+        rule_files = scan_files(self.store.root / ".cursor" / "rules", ".mdc")
+        for f, text in zip(rule_files, read_texts(rule_files)):
+            metadata, body = parse_mdc(text)
+            items.append({
+                "type": "knowledge",
+                "key": f"cursor-rule-{f.stem}",
+                "source": f".cursor/rules/{f.name}",
+                "content": body,
+                "metadata": metadata,
+            })
 
         # .cursorrules (legacy)
-        cursorrules = self.store.root / ".cursorrules"
-        if cursorrules.is_file():
+        cursorrules = read_file_if_exists(self.store.root / ".cursorrules")
+        if cursorrules is not None:
             items.append({
                 "type": "knowledge",
                 "key": "cursorrules",
                 "source": ".cursorrules",
-                "content": cursorrules.read_text().strip(),
+                "content": cursorrules.strip(),
             })
 
         # .cursor/skills/*/SKILL.md
-        skills_dir = self.store.root / ".cursor" / "skills"
-        if skills_dir.is_dir():
-            for skill_md in sorted(skills_dir.glob("*/SKILL.md")):
-                items.append({
-                    "type": "skill",
-                    "key": skill_md.parent.name,
-                    "source": f".cursor/skills/{skill_md.parent.name}/SKILL.md",
-                    "content": skill_md.read_text(),
-                })
+        skill_files = scan_skill_files(self.store.root / ".cursor" / "skills")
+        for skill_md, content in zip(skill_files, read_texts(skill_files)):
+            items.append({
+                "type": "skill",
+                "key": skill_md.parent.name,
+                "source": f".cursor/skills/{skill_md.parent.name}/SKILL.md",
+                "content": content,
+            })
 
         if dry_run:
             return {"items": items, "imported": 0, "dry_run": True}
 
-        imported = 0
-        for item in items:
-            if item["type"] == "skill":
-                self.store.set_skill(
-                    item["key"],
-                    item["content"],
-                    agent=f"import:cursor ({get_author()})",
-                )
-            else:
-                self.store.set_knowledge(
-                    item["key"],
-                    item["content"],
-                    author=f"import:cursor ({get_author()})",
-                )
-            imported += 1
-
+        imported = write_import_items(self.store, items, "cursor")
         return {"items": items, "imported": imported, "dry_run": False}
 
     def export_context(self, dry_run: bool = False) -> dict:
         items: list[dict] = []
         conventions = self.store.list_conventions(scope=Scope.public)
-        knowledge = self.store.list_knowledge(scope=Scope.public)
+        knowledge = [
+            e for e in self.store.list_knowledge(scope=Scope.public)
+            if e.key != PROJECT_INSTRUCTIONS_KEY
+        ]
         skills = self.store.list_skills(scope=Scope.public)
 
         if not conventions and not knowledge and not skills:
@@ -122,41 +121,27 @@ class CursorAdapter:
         exported = 0
         rules_dir = self.store.root / ".cursor" / "rules"
 
-        # Export conventions as MDC rules
-        if conventions:
-            rules_dir.mkdir(parents=True, exist_ok=True)
-            for entry in conventions:
-                metadata = {
-                    "description": f"Team convention: {entry.key}",
-                    "alwaysApply": True,
-                }
-                mdc_content = format_mdc(metadata, entry.content)
-                rule_path = rules_dir / f"ctx-convention-{entry.key}.mdc"
-                rule_path.write_text(mdc_content)
-                exported += 1
-
-        # Export knowledge as MDC rules
-        if knowledge:
+        # Export conventions and knowledge as MDC rules
+        if conventions or knowledge:
             rules_dir.mkdir(parents=True, exist_ok=True)
-            for entry in knowledge:
-                if entry.key == "project-instructions":
-                    continue
-                metadata = {
-                    "description": f"Team context: {entry.key}",
-                    "alwaysApply": True,
-                }
-                mdc_content = format_mdc(metadata, entry.content)
-                rule_path = rules_dir / f"ctx-{entry.key}.mdc"
-                rule_path.write_text(mdc_content)
+            rules = [
+                (f"ctx-convention-{e.key}.mdc", f"Team convention: {e.key}", e.content)
+                for e in conventions
+            ]
+            rules += [(f"ctx-{e.key}.mdc", f"Team context: {e.key}", e.content) for e in knowledge]
+            for filename, description, content in rules:
+                mdc_content = _MDC_RULE_TEMPLATE.format(
+                    description=description, body=content.strip()
+                )
+                write_file(rules_dir / filename, mdc_content)
                 exported += 1
 
         # Export skills
         if skills:
             skills_dir = self.store.root / ".cursor" / "skills"
+            ensure_subdirs(skills_dir, [skill.name for skill in skills])
             for skill in skills:
-                skill_out = skills_dir / skill.name
-                skill_out.mkdir(parents=True, exist_ok=True)
-                (skill_out / "SKILL.md").write_text(skill.content)
+                write_file(skills_dir / skill.name / "SKILL.md", skill.content)
                 exported += 1
 
         return {"items": items, "exported": exported, "dry_run": False}
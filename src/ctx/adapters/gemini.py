@@ -5,10 +5,19 @@ from __future__ import annotations
 import logging
 from pathlib import Path
 
+from ctx.adapters._import import write_import_items
 from ctx.adapters._mcp_reg import register_mcp_json, unregister_mcp_json
+from ctx.adapters._scan import (
+    ensure_subdirs,
+    read_file_if_exists,
+    read_texts,
+    scan_files,
+    scan_skill_files,
+    write_file,
+)
+from ctx.adapters.base import PROJECT_INSTRUCTIONS_KEY
 from ctx.core.scope import Scope
 from ctx.core.store import ContextStore
-from ctx.utils.paths import get_author
 
 logger = logging.getLogger(__name__)
 
@@ -30,72 +39,58 @@ class GeminiAdapter:
         items: list[dict] = []
 
         # .gemini/rules/*.md
-        rules_dir = self.store.root / ".gemini" / "rules"
-        if rules_dir.is_dir():
-            for f in sorted(rules_dir.glob("*.md")):
-                items.append({
-                    "type": "knowledge",
-                    "key": f"gemini-rule-{f.stem}",
-                    "source": f".gemini/rules/{f.name}",
-                    "content": f.read_text().strip(),
-                })
+        rule_files = scan_files(self.store.root / ".gemini" / "rules", ".md")
+        for f, text in zip(rule_files, read_texts(rule_files)):
+            items.append({
+                "type": "knowledge",
+                "key": f"gemini-rule-{f.stem}",
+                "source": f".gemini/rules/{f.name}",
+                "content": text.strip(),
+            })
 
         # .gemini/STYLEGUIDE.md
-        styleguide = self.store.root / ".gemini" / "STYLEGUIDE.md"
-        if styleguide.is_file():
+        styleguide = read_file_if_exists(self.store.root / ".gemini" / "STYLEGUIDE.md")
+        if styleguide is not None:
             items.append({
                 "type": "knowledge",
                 "key": "gemini-styleguide",
                 "source": ".gemini/STYLEGUIDE.md",
-                "content": styleguide.read_text().strip(),
+                "content": styleguide.strip(),
             })
 
         # GEMINI.md
-        gemini_md = self.store.root / "GEMINI.md"
-        if gemini_md.is_file():
+        gemini_md = read_file_if_exists(self.store.root / "GEMINI.md")
+        if gemini_md is not None:
             items.append({
                 "type": "knowledge",
                 "key": "gemini-instructions",
                 "source": "GEMINI.md",
-                "content": gemini_md.read_text().strip(),
+                "content": gemini_md.strip(),
             })
 
         # .gemini/skills/*/SKILL.md
-        skills_dir = self.store.root / ".gemini" / "skills"
-        if skills_dir.is_dir():
-            for skill_md in sorted(skills_dir.glob("*/SKILL.md")):
-                items.append({
-                    "type": "skill",
-                    "key": skill_md.parent.name,
-                    "source": f".gemini/skills/{skill_md.parent.name}/SKILL.md",
-                    "content": skill_md.read_text(),
-                })
+        skill_files = scan_skill_files(self.store.root / ".gemini" / "skills")
+        for skill_md, content in zip(skill_files, read_texts(skill_files)):
+            items.append({
+                "type": "skill",
+                "key": skill_md.parent.name,
+                "source": f".gemini/skills/{skill_md.parent.name}/SKILL.md",
+                "content": content,
+            })
 
         if dry_run:
             return {"items": items, "imported": 0, "dry_run": True}
 
-        imported = 0
-        for item in items:
-            if item["type"] == "skill":
-                self.store.set_skill(
-                    item["key"],
-                    item["content"],
-                    agent=f"import:gemini ({get_author()})",
-                )
-            else:
-                self.store.set_knowledge(
-                    item["key"],
-                    item["content"],
-                    author=f"import:gemini ({get_author()})",
-                )
-            imported += 1
-
+        imported = write_import_items(self.store, items, "gemini")
         return {"items": items, "imported": imported, "dry_run": False}
 
     def export_context(self, dry_run: bool = False) -> dict:
         items: list[dict] = []
         conventions = self.store.list_conventions(scope=Scope.public)
-        knowledge = self.store.list_knowledge(scope=Scope.public)
+        knowledge = [
+            e for e in self.store.list_knowledge(scope=Scope.public)
+            if e.key != PROJECT_INSTRUCTIONS_KEY
+        ]
         skills = self.store.list_skills(scope=Scope.public)
 
         if not conventions and not knowledge and not skills:
@@ -124,29 +119,26 @@ class GeminiAdapter:
 
         exported = 0
         rules_dir = self.store.root / ".gemini" / "rules"
+        if conventions or knowledge:
+            rules_dir.mkdir(parents=True, exist_ok=True)
 
         if conventions:
-            rules_dir.mkdir(parents=True, exist_ok=True)
             for entry in conventions:
                 rule_path = rules_dir / f"ctx-convention-{entry.key}.md"
-                rule_path.write_text(entry.content.strip() + "\n")
+                write_file(rule_path, entry.content.strip() + "\n")
                 exported += 1
 
         if knowledge:
-            rules_dir.mkdir(parents=True, exist_ok=True)
             for entry in knowledge:
-                if entry.key == "project-instructions":
-                    continue
                 rule_path = rules_dir / f"ctx-{entry.key}.md"
-                rule_path.write_text(entry.content.strip() + "\n")
+                write_file(rule_path, entry.content.strip() + "\n")
                 exported += 1
 
         if skills:
             skills_dir = self.store.root / ".gemini" / "skills"
+            ensure_subdirs(skills_dir, [skill.name for skill in skills])
             for skill in skills:
-                skill_out = skills_dir / skill.name
-                skill_out.mkdir(parents=True, exist_ok=True)
-                (skill_out / "SKILL.md").write_text(skill.content)
+                write_file(skills_dir / skill.name / "SKILL.md", skill.content)
                 exported += 1
 
         return {"items": items, "exported": exported, "dry_run": False}
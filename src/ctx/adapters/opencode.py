@@ -2,44 +2,62 @@
 
 from __future__ import annotations
 
+import heapq
 import json
 import logging
-import shutil
+import operator
 from pathlib import Path
 
 from ctx.adapters._agents_md import parse_agents_md, write_agents_md_section
+from ctx.adapters._import import write_import_items
 from ctx.adapters._mcp_reg import register_mcp_opencode, unregister_mcp_opencode
+from ctx.adapters._scan import (
+    ensure_subdirs,
+    read_file_if_exists,
+    read_texts,
+    scan_skill_files,
+    write_file,
+)
+from ctx.adapters.base import PROJECT_INSTRUCTIONS_KEY
 from ctx.core.scope import Scope
 from ctx.core.store import ContextStore
-from ctx.utils.paths import get_author, opencode_data_dir
+from ctx.utils.paths import (
+    atomic_write_text,
+    executable_on_path,
+    opencode_data_dir,
+)
 
 logger = logging.getLogger(__name__)
 
+# Session summaries imported per run, most recent first
+_MAX_SESSIONS = 20
+
 
 class OpenCodeAdapter:
     name = "opencode"
 
     def __init__(self, store: ContextStore) -> None:
         self.store = store
+        self._project_id: str | None = None
 
     def detect(self) -> bool:
         """Check for opencode binary and/or .opencode/ directory."""
-        if shutil.which("opencode") is not None:
-            return True
+        # Project-local markers are a single stat each; only fall back to
+        # walking PATH when neither is present
         if (self.store.root / ".opencode").is_dir():
             return True
         if (self.store.root / "opencode.json").is_file():
             return True
-        return False
+        return executable_on_path("opencode")
 
     def import_context(self, dry_run: bool = False) -> dict:
         """Import from OpenCode native formats."""
         items: list[dict] = []
 
         # 1. AGENTS.md
-        agents_md = self.store.root / "AGENTS.md"
-        if agents_md.is_file():
-            entries = parse_agents_md(agents_md.read_text())
+        agents_text = read_file_if_exists(self.store.root / "AGENTS.md")
+        if agents_text is not None:
+            entries = parse_agents_md(agents_text)
             for key, content in entries:
                 items.append({
                     "type": "knowledge",
@@ -58,36 +76,19 @@ class OpenCodeAdapter:
         items.extend(self._read_session_summaries())
 
         # 5. Skills
-        skills_dir = self.store.root / ".opencode" / "skills"
-        if skills_dir.is_dir():
-            for skill_md in sorted(skills_dir.glob("*/SKILL.md")):
-                items.append({
-                    "type": "skill",
-                    "key": skill_md.parent.name,
-                    "source": f".opencode/skills/{skill_md.parent.name}/SKILL.md",
-                    "content": skill_md.read_text(),
-                })
+        skill_files = scan_skill_files(self.store.root / ".opencode" / "skills")
+        for skill_md, content in zip(skill_files, read_texts(skill_files)):
+            items.append({
+                "type": "skill",
+                "key": skill_md.parent.name,
+                "source": f".opencode/skills/{skill_md.parent.name}/SKILL.md",
+                "content": content,
+            })
 
         if dry_run:
             return {"items": items, "imported": 0, "dry_run": True}
 
-        imported = 0
-        for item in items:
-            if item["type"] == "skill":
-                self.store.set_skill(
-                    item["key"],
-                    item["content"],
-                    agent=f"import:opencode ({get_author()})",
-                )
-                imported += 1
-            elif item["type"] == "knowledge":
-                self.store.set_knowledge(
-                    item["key"],
-                    item["content"],
-                    author=f"import:opencode ({get_author()})",
-                )
-                imported += 1
-
+        imported = write_import_items(self.store, items, "opencode")
         return {"items": items, "imported": imported, "dry_run": False}
 
     def _read_agents(self) -> list[dict]:
@@ -95,9 +96,9 @@ class OpenCodeAdapter:
         items: list[dict] = []
         for dir_name in ("agents", "agent"):
             agents_dir = self.store.root / ".opencode" / dir_name
-            if not agents_dir.is_dir():
-                continue
-            for md_path in sorted(agents_dir.rglob("*.md")):
+            # rglob yields nothing for a missing directory, no is_dir() needed
+            md_paths = sorted(agents_dir.rglob("*.md"))
+            for md_path, content in zip(md_paths, read_texts(md_paths)):
                 rel = md_path.relative_to(agents_dir)
                 # Key from relative path: python/linter.md -> opencode-agent-python-linter
                 key_parts = list(rel.parent.parts) + [rel.stem]
@@ -106,7 +107,7 @@ class OpenCodeAdapter:
                     "type": "knowledge",
                     "key": key,
                     "source": f".opencode/{dir_name}/{rel}",
-                    "content": md_path.read_text(),
+                    "content": content,
                 })
         return items
 
@@ -115,9 +116,8 @@ class OpenCodeAdapter:
         items: list[dict] = []
         for dir_name in ("commands", "command"):
             cmds_dir = self.store.root / ".opencode" / dir_name
-            if not cmds_dir.is_dir():
-                continue
-            for md_path in sorted(cmds_dir.rglob("*.md")):
+            md_paths = sorted(cmds_dir.rglob("*.md"))
+            for md_path, content in zip(md_paths, read_texts(md_paths)):
                 rel = md_path.relative_to(cmds_dir)
                 key_parts = list(rel.parent.parts) + [rel.stem]
                 key = "opencode-command-" + "-".join(key_parts)
@@ -125,18 +125,26 @@ class OpenCodeAdapter:
                     "type": "knowledge",
                     "key": key,
                     "source": f".opencode/{dir_name}/{rel}",
-                    "content": md_path.read_text(),
+                    "content": content,
                 })
         return items
 
     def _get_project_id(self) -> str | None:
-        """Get the git root commit hash, used by OpenCode as project ID."""
+        """Get the git root commit hash, used by OpenCode as project ID.
+
+        A root commit never changes, so a successful lookup (which opens the
+        repo and runs ``git rev-list``) is kept for the adapter's lifetime.
+        Failures are not cached: the repo may gain its first commit later.
+        """
+        if self._project_id is not None:
+            return self._project_id
         try:
             from git import InvalidGitRepositoryError, Repo
 
             repo = Repo(self.store.root, search_parent_directories=True)
             root_commits = repo.git.rev_list("HEAD", max_parents=0).strip().split("\n")
-            return root_commits[0] if root_commits else None
+            self._project_id = root_commits[0] if root_commits else None
+            return self._project_id
         except InvalidGitRepositoryError:
             logger.warning("Not a git repository, cannot determine OpenCode project ID: %s", self.store.root)
             return None
@@ -155,28 +163,27 @@ class OpenCodeAdapter:
             logger.warning("OpenCode session data directory not found: %s", sessions_dir)
             return []
 
-        # Collect session files with their timestamps for sorting
-        session_entries: list[tuple[float, Path]] = []
+        # Parse every session file once, keeping the data alongside its
+        # timestamp so the most recent ones need not be read again
+        session_entries: list[tuple[float, Path, dict]] = []
         for json_path in sessions_dir.glob("*.json"):
             try:
-                data = json.loads(json_path.read_text())
+                data = json.loads(json_path.read_bytes())
                 # Use time.updated if available, else file mtime
                 ts = data.get("time", {}).get("updated", 0)
                 if not ts:
                     ts = json_path.stat().st_mtime
-                session_entries.append((ts, json_path))
-            except (json.JSONDecodeError, OSError) as exc:
+                session_entries.append((ts, json_path, data))
+            except (json.JSONDecodeError, UnicodeDecodeError, OSError) as exc:
                 logger.warning("Failed to parse session file %s: %s", json_path, exc)
                 continue
 
-        # Sort by timestamp descending, limit to 20
-        session_entries.sort(key=lambda x: x[0], reverse=True)
-        session_entries = session_entries[:20]
+        # Most recent first, limited to 20 (same order as a stable sort)
+        recent = heapq.nlargest(_MAX_SESSIONS, session_entries, key=operator.itemgetter(0))
 
         items: list[dict] = []
-        for _ts, json_path in session_entries:
+        for _ts, json_path, data in recent:
             try:
-                data = json.loads(json_path.read_text())
                 session_id = json_path.stem
                 title = data.get("title", "Untitled session")
                 summary = data.get("summary", {})
@@ -198,7 +205,7 @@ class OpenCodeAdapter:
                     "source": f"opencode/storage/session/{project_id}/{json_path.name}",
                     "content": "\n".join(lines),
                 })
-            except (json.JSONDecodeError, OSError, KeyError):
+            except KeyError:
                 continue
 
         return items
@@ -207,7 +214,10 @@ class OpenCodeAdapter:
         """Export store content to AGENTS.md managed section and skills."""
         items: list[dict] = []
         conventions = self.store.list_conventions(scope=Scope.public)
-        knowledge = self.store.list_knowledge(scope=Scope.public)
+        knowledge = [
+            e for e in self.store.list_knowledge(scope=Scope.public)
+            if e.key != PROJECT_INSTRUCTIONS_KEY
+        ]
         decisions = self.store.list_decisions(scope=Scope.public)
         skills = self.store.list_skills(scope=Scope.public)
 
@@ -236,29 +246,28 @@ class OpenCodeAdapter:
 
         if conventions or knowledge or decisions:
             agents_md_path = self.store.root / "AGENTS.md"
-            existing = agents_md_path.read_text() if agents_md_path.is_file() else ""
+            existing = read_file_if_exists(agents_md_path) or ""
             # Conventions first, then knowledge, then decisions
-            entries: list[tuple[str, str]] = []
-            for e in conventions:
-                entries.append((f"convention: {e.key}", e.content))
-            for e in knowledge:
-                if e.key != "project-instructions":
-                    entries.append((e.key, e.content))
+            entries = [(f"convention: {e.key}", e.content) for e in conventions]
+            entries += [(e.key, e.content) for e in knowledge]
             if decisions:
-                decision_lines = []
-                for d in decisions:
-                    decision_lines.append(f"- **{d.id:04d}** {d.title} ({d.status.value})")
-                entries.append(("decisions", "\n".join(decision_lines)))
+                entries.append((
+                    "decisions",
+                    "\n".join(
+                        f"- **{d.id:04d}** {d.title} ({d.status.value})" for d in decisions
+                    ),
+                ))
             result = write_agents_md_section(existing, entries)
-            agents_md_path.write_text(result)
+            # Leave AGENTS.md (and its mtime) alone when nothing changed
+            if result != existing:
+                atomic_write_text(agents_md_path, result)
             exported += 1
 
         if skills:
             skills_dir = self.store.root / ".opencode" / "skills"
+            ensure_subdirs(skills_dir, [skill.name for skill in skills])
             for skill in skills:
-                skill_out = skills_dir / skill.name
-                skill_out.mkdir(parents=True, exist_ok=True)
-                (skill_out / "SKILL.md").write_text(skill.content)
+                write_file(skills_dir / skill.name / "SKILL.md", skill.content)
                 exported += 1
 
         return {"items": items, "exported": exported, "dry_run": False}
@@ -1,41 +1,58 @@
-"""Adapter discovery and registration."""
+"""Adapter discovery and registration.
+
+Adapters are registered as ``"module:Class"`` specs and imported on first
+use, so looking up one adapter does not import all of them.
+"""
 
 from __future__ import annotations
 
+import functools
+import importlib
+from concurrent.futures import ThreadPoolExecutor
+
 from ctx.adapters.base import AdapterProtocol
-from ctx.adapters.claude_code import ClaudeCodeAdapter
-from ctx.adapters.codex import CodexAdapter
-from ctx.adapters.cursor import CursorAdapter
-from ctx.adapters.gemini import GeminiAdapter
-from ctx.adapters.opencode import OpenCodeAdapter
 from ctx.core.store import ContextStore
 
 
-_ADAPTER_CLASSES = {
-    "claude_code": ClaudeCodeAdapter,
-    "opencode": OpenCodeAdapter,
-    "codex": CodexAdapter,
-    "gemini": GeminiAdapter,
-    "cursor": CursorAdapter,
+_ADAPTER_SPECS = {
+    "claude_code": "ctx.adapters.claude_code:ClaudeCodeAdapter",
+    "opencode": "ctx.adapters.opencode:OpenCodeAdapter",
+    "codex": "ctx.adapters.codex:CodexAdapter",
+    "gemini": "ctx.adapters.gemini:GeminiAdapter",
+    "cursor": "ctx.adapters.cursor:CursorAdapter",
 }
 
 
+@functools.cache
+def _load_adapter_class(spec: str) -> type:
+    """Import and return the class named by a ``"module:Class"`` spec."""
+    module_name, _, class_name = spec.partition(":")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
 def get_adapter(name: str, store: ContextStore) -> AdapterProtocol | None:
     """Get an adapter instance by name."""
-    cls = _ADAPTER_CLASSES.get(name)
-    if cls is None:
+    spec = _ADAPTER_SPECS.get(name)
+    if spec is None:
         return None
-    return cls(store)
+    return _load_adapter_class(spec)(store)
 
 
 def list_adapters() -> list[str]:
-    return list(_ADAPTER_CLASSES.keys())
+    return list(_ADAPTER_SPECS.keys())
 
 
 def detect_adapters(store: ContextStore) -> dict[str, bool]:
-    """Check which adapters are available."""
-    result = {}
-    for name, cls in _ADAPTER_CLASSES.items():
-        adapter = cls(store)
-        result[name] = adapter.detect()
-    return result
+    """Check which adapters are available.
+
+    Each adapter's import and detect() (PATH lookups and file probes) run in
+    a thread of their own, so a slow filesystem costs one round-trip rather
+    than one per adapter.
+    """
+
+    def detect(spec: str) -> bool:
+        return _load_adapter_class(spec)(store).detect()
+
+    with ThreadPoolExecutor(max_workers=len(_ADAPTER_SPECS)) as pool:
+        detected = pool.map(detect, _ADAPTER_SPECS.values())
+        return dict(zip(_ADAPTER_SPECS, detected))
@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import functools
+import os
+from pathlib import Path
+
 import typer
 
 from ctx.core.store import ContextStore
@@ -12,8 +16,17 @@ FORMAT_OPTION = typer.Option(None, "--format", "-F", help="Output format: json o
 
 
 def get_store() -> ContextStore:
-    """Resolve the project root and return a ContextStore."""
-    root = find_project_root()
+    """Resolve the project root and return a ContextStore.
+
+    The root is resolved once per working directory: commands that call
+    get_store() from several helpers share one directory walk.
+    """
+    return _store_for_cwd(os.getcwd())
+
+
+@functools.lru_cache(maxsize=1)
+def _store_for_cwd(cwd: str) -> ContextStore:
+    root = find_project_root(Path(cwd))
     if root is None:
         error("Not inside a project directory (no .git or .context-teleport found)")
         raise typer.Exit(1)
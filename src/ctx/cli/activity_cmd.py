@@ -20,9 +20,8 @@ def activity_list(
     store = get_store()
     entries = store.list_activity()
     if fmt == "json":
-        items = []
-        for a in entries:
-            items.append({
+        items = [
+            {
                 "member": a.member,
                 "agent": a.agent,
                 "machine": a.machine,
@@ -30,7 +29,9 @@ def activity_list(
                 "issue_ref": a.issue_ref,
                 "status": a.status,
                 "stale": store.is_stale(a),
-            })
+            }
+            for a in entries
+        ]
         output(items, fmt="json")
     else:
         if not entries:
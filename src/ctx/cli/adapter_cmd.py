@@ -44,6 +44,8 @@ def _import_adapter(adapter_name: str, label: str, dry_run: bool, fmt: str | Non
         imported = result.get("imported", 0)
         if imported:
             success(f"Imported {imported} items from {label}")
+        elif result.get("cached"):
+            info(f"{label} sources unchanged since the last import")
         else:
             info(f"Nothing to import from {label}")
 
@@ -69,6 +71,8 @@ def _export_adapter(adapter_name: str, label: str, dry_run: bool, fmt: str | Non
         exported = result.get("exported", 0)
         if exported:
             success(f"Exported {exported} items to {label}")
+        elif result.get("unchanged"):
+            info(f"{label} already up to date with the store")
         else:
             info("Nothing to export")
 
@@ -319,10 +323,8 @@ def import_eda(
     # Write to store
     store = get_store()
     author = f"import:eda-{importer.name} ({get_author()})"
-    imported = 0
-    for item in items:
-        store.set_knowledge(item.key, item.content, author=author)
-        imported += 1
+    store.set_knowledge_many(((item.key, item.content) for item in items), author=author)
+    imported = len(items)
 
     if fmt == "json":
         output(
@@ -433,10 +435,8 @@ def import_artifacts(
     # Write to store
     store = get_store()
     author = f"import:artifact-{importer.name} ({get_author()})"
-    imported = 0
-    for item in items:
-        store.set_knowledge(item.key, item.content, author=author)
-        imported += 1
+    store.set_knowledge_many(((item.key, item.content) for item in items), author=author)
+    imported = len(items)
 
     if fmt == "json":
         output(
@@ -534,13 +534,9 @@ def import_conventions(
 
 def _slugify_header(text: str) -> str:
     """Convert a header to a convention key."""
-    import re
+    from ctx.adapters._agents_md import _slugify
 
-    text = text.lower().strip()
-    text = re.sub(r"[^\w\s-]", "", text)
-    text = re.sub(r"[\s_]+", "-", text)
-    text = re.sub(r"-+", "-", text).strip("-")
-    return text or "untitled"
+    return _slugify(text)
 
 
 def _split_conventions_file(text: str) -> list[tuple[str, str]]:
@@ -553,47 +549,21 @@ def _split_conventions_file(text: str) -> list[tuple[str, str]]:
     """
     import re
 
-    sections: list[tuple[str, str]] = []
-
-    # Try ## headers
-    current_key = ""
-    current_lines: list[str] = []
-    for line in text.split("\n"):
-        match = re.match(r"^##\s+(.+)", line)
-        if match:
-            if current_key and current_lines:
-                sections.append((current_key, "\n".join(current_lines).strip()))
-            current_key = _slugify_header(match.group(1))
-            current_lines = [line]
-        else:
-            current_lines.append(line)
-    if current_key and current_lines:
-        sections.append((current_key, "\n".join(current_lines).strip()))
-
-    if sections:
-        return sections
-
-    # Try # headers (skip first if it's a document title)
-    current_key = ""
-    current_lines = []
-    first_header = True
-    for line in text.split("\n"):
-        match = re.match(r"^#\s+(.+)", line)
-        if match:
-            if first_header:
-                # Skip title header, but save any accumulated preamble
-                first_header = False
-                current_lines = []
-                continue
-            if current_key and current_lines:
-                sections.append((current_key, "\n".join(current_lines).strip()))
-            current_key = _slugify_header(match.group(1))
-            current_lines = [line]
-        else:
-            current_lines.append(line)
-    if current_key and current_lines:
-        sections.append((current_key, "\n".join(current_lines).strip()))
-
+    # One scan of the whole text per header level; each section is sliced
+    # from its header to the next one
+    headers = list(re.finditer(r"^##[^\S\n]+(.+)", text, re.MULTILINE))
+    skip = 0
+    if not headers:
+        # Fall back to # headers, skipping the first as the document title
+        headers = list(re.finditer(r"^#[^\S\n]+(.+)", text, re.MULTILINE))
+        skip = 1
+
+    ends = [m.start() for m in headers[1:]]
+    ends.append(len(text))
+    sections = [
+        (_slugify_header(m.group(1)), text[m.start() : end].strip())
+        for m, end in zip(headers[skip:], ends[skip:])
+    ]
     if sections:
         return sections
 
@@ -712,13 +682,12 @@ def import_github(
 
     store = get_store()
     author = f"import:github ({get_author()})"
-    imported_knowledge = 0
+    knowledge: list[tuple[str, str]] = []
     imported_decisions = 0
 
     for it in items:
         if it.type == "knowledge":
-            store.set_knowledge(it.key, it.content, author=author)
-            imported_knowledge += 1
+            knowledge.append((it.key, it.content))
         elif it.type == "decision":
             store.add_decision(
                 title=it.title,
@@ -728,6 +697,8 @@ def import_github(
                 author=author,
             )
             imported_decisions += 1
+    store.set_knowledge_many(knowledge, author=author)
+    imported_knowledge = len(knowledge)
 
     total = imported_knowledge + imported_decisions
     if fmt == "json":
@@ -7,8 +7,12 @@ formats. Simple key: value parsing -- no PyYAML dependency needed.
 
 from __future__ import annotations
 
+import io
 import re
 
+# Closing delimiter of a frontmatter block
+_FM_END_RE = re.compile(r"\n---\s*\n")
+
 
 def parse_frontmatter(text: str) -> tuple[dict, str]:
     """Parse YAML frontmatter + markdown body.
@@ -19,13 +23,13 @@ def parse_frontmatter(text: str) -> tuple[dict, str]:
     if not text.startswith("---"):
         return {}, text
 
-    # Find closing ---
-    end_match = re.search(r"\n---\s*\n", text[3:])
+    # Find closing --- (searching from offset 3 avoids copying the text)
+    end_match = _FM_END_RE.search(text, 3)
     if not end_match:
         return {}, text
 
-    frontmatter_text = text[3 : 3 + end_match.start()]
-    body = text[3 + end_match.end() :]
+    frontmatter_text = text[3 : end_match.start()]
+    body = text[end_match.end() :]
 
     # Simple YAML parsing (key: value lines)
     metadata: dict = {}
@@ -35,9 +39,10 @@ def parse_frontmatter(text: str) -> tuple[dict, str]:
             key = key.strip()
             value = value.strip()
             # Handle booleans
-            if value.lower() == "true":
+            lowered = value.lower()
+            if lowered == "true":
                 value = True
-            elif value.lower() == "false":
+            elif lowered == "false":
                 value = False
             # Handle arrays like ["**/*.py"]
             elif value.startswith("[") and value.endswith("]"):
@@ -52,17 +57,18 @@ def build_frontmatter(metadata: dict, body: str) -> str:
 
     Returns the complete document string with ``---`` delimiters.
     """
-    lines = ["---"]
+    buf = io.StringIO()
+    w = buf.write
+    w("---\n")
     for key, value in metadata.items():
         if isinstance(value, bool):
-            lines.append(f"{key}: {'true' if value else 'false'}")
+            w(f"{key}: {'true' if value else 'false'}\n")
         elif isinstance(value, list):
             formatted = ", ".join(f'"{v}"' for v in value)
-            lines.append(f"{key}: [{formatted}]")
+            w(f"{key}: [{formatted}]\n")
         else:
-            lines.append(f"{key}: {value}")
-    lines.append("---")
-    lines.append("")
-    lines.append(body.strip())
-    lines.append("")
-    return "\n".join(lines)
+            w(f"{key}: {value}\n")
+    w("---\n\n")
+    w(body.strip())
+    w("\n")
+    return buf.getvalue()
@@ -7,6 +7,10 @@ from dataclasses import dataclass
 
 from ctx.core.merge import MergeResult
 
+# Lines that start with exactly ## (not ### or more)
+_SECTION_HEADER_RE = re.compile(r"^(## .+)$", re.MULTILINE)
+_HEADER_PREFIX_RE = re.compile(r"^#{1,6}\s*")
+
 
 @dataclass
 class Section:
@@ -16,11 +20,8 @@ class Section:
 
 def parse_sections(text: str) -> list[Section]:
     """Split markdown by ## headers. Content before first ## is the preamble."""
-    # Match lines that start with exactly ## (not ### or more)
-    pattern = re.compile(r"^(## .+)$", re.MULTILINE)
-
     sections: list[Section] = []
-    matches = list(pattern.finditer(text))
+    matches = list(_SECTION_HEADER_RE.finditer(text))
 
     if not matches:
         # No ## headers at all -- entire text is preamble
@@ -43,7 +44,7 @@ def parse_sections(text: str) -> list[Section]:
 
 def _normalize_header(header: str) -> str:
     """Normalize header for comparison: strip ## prefix, lowercase, strip whitespace."""
-    return re.sub(r"^#{1,6}\s*", "", header).strip().lower()
+    return _HEADER_PREFIX_RE.sub("", header).strip().lower()
 
 
 def _sections_to_dict(sections: list[Section]) -> dict[str, Section]:
@@ -56,6 +56,23 @@ class ScopeMap:
         except ValueError:
             return Scope.public
 
+    def scopes(self) -> dict[str, Scope]:
+        """Return every non-public filename mapped to its scope.
+
+        Reads the sidecar once; use it instead of ``get`` in loops over a
+        whole directory. Unrecognised values are treated as public, as in
+        ``get``.
+        """
+        result: dict[str, Scope] = {}
+        for filename, raw in self._read().items():
+            try:
+                scope = Scope(raw)
+            except ValueError:
+                continue
+            if scope != Scope.public:
+                result[filename] = scope
+        return result
+
     def set(self, filename: str, scope: Scope) -> None:
         """Set scope for a filename. Setting public removes the entry."""
         data = self._read()
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import operator
 import re
+from collections.abc import Iterable
 from pathlib import Path
 
 from ctx.core.schema import (
@@ -27,8 +29,25 @@ from ctx.core.schema import (
     UserPreferences,
 )
 from ctx.core.scope import Scope, ScopeMap
-from ctx.utils.paths import STORE_DIR, get_author, get_machine_name, get_username, sanitize_key
+from ctx.utils.paths import (
+    EXPORTS_FINGERPRINT_FILE,
+    FINGERPRINT_FILES,
+    IMPORTS_FINGERPRINT_FILE,
+    STORE_DIR,
+    atomic_write_text,
+    get_author,
+    get_machine_name,
+    get_username,
+    sanitize_key,
+    scan_skill_files,
+)
+
+# Sort keys for directory listings: glob returns fresh Path objects, and
+# comparing them by a plain string is much cheaper than Path ordering.
+_BY_NAME = operator.attrgetter("name")
 
+# Decision files are named "<id>-<slug>.md"
+_DECISION_ID_RE = re.compile(r"(\d+)-")
 
 MAX_SESSIONS = 200
 
@@ -106,7 +125,12 @@ class ContextStore:
 
     # -- Scope management --
 
-    _GITIGNORE_BASE = ["state/active.json", "preferences/user.json", ".pending_conflicts.json"]
+    _GITIGNORE_BASE = [
+        "state/active.json",
+        *FINGERPRINT_FILES,
+        "preferences/user.json",
+        ".pending_conflicts.json",
+    ]
 
     def _knowledge_meta_path(self) -> Path:
         return self.knowledge_dir() / ".meta.json"
@@ -236,17 +260,19 @@ class ContextStore:
         cdir = self.conventions_dir()
         if not cdir.is_dir():
             return []
-        smap = self._conventions_scope_map()
+        # Sidecars are read once per listing, not once per file
+        scopes = self._conventions_scope_map().scopes()
+        meta = self._read_convention_meta()
         entries = []
-        for f in sorted(cdir.glob("*.md")):
-            if scope is not None and smap.get(f.name) != scope:
+        for f in sorted(cdir.glob("*.md"), key=_BY_NAME):
+            if scope is not None and scopes.get(f.name, Scope.public) != scope:
                 continue
             entries.append(
                 ConventionEntry(
                     key=f.stem,
                     content=f.read_text(),
                     updated_at=_datetime_from_mtime(f),
-                    author=self._get_convention_author(f.name),
+                    author=meta.get(f.name, {}).get("author", ""),
                 )
             )
         return entries
@@ -336,18 +362,20 @@ class ContextStore:
 
     def list_knowledge(self, scope: Scope | None = None) -> list[KnowledgeEntry]:
         self._require_init()
-        smap = self._knowledge_scope_map()
+        # Sidecars are read once per listing, not once per file
+        scopes = self._knowledge_scope_map().scopes()
+        meta = self._read_knowledge_meta()
         entries = []
         kdir = self.knowledge_dir()
-        for f in sorted(kdir.glob("*.md")):
-            if scope is not None and smap.get(f.name) != scope:
+        for f in sorted(kdir.glob("*.md"), key=_BY_NAME):
+            if scope is not None and scopes.get(f.name, Scope.public) != scope:
                 continue
             entries.append(
                 KnowledgeEntry(
                     key=f.stem,
                     content=f.read_text(),
                     updated_at=_datetime_from_mtime(f),
-                    author=self._get_knowledge_author(f.name),
+                    author=meta.get(f.name, {}).get("author", ""),
                 )
             )
         return entries
@@ -383,6 +411,32 @@ class ContextStore:
             author=resolved_author,
         )
 
+    def set_knowledge_many(
+        self, entries: Iterable[tuple[str, str]], author: str = ""
+    ) -> list[KnowledgeEntry]:
+        """Write several (key, content) knowledge entries with one author.
+
+        Equivalent to calling set_knowledge for each entry, but the author
+        sidecar is read and rewritten once rather than once per entry.
+        """
+        self._require_init()
+        resolved_author = author or get_author()
+        kdir = self.knowledge_dir()
+        meta = self._read_knowledge_meta()
+        written: list[KnowledgeEntry] = []
+        try:
+            for key, content in entries:
+                safe_key = sanitize_key(key)
+                (kdir / f"{safe_key}.md").write_text(content)
+                meta.setdefault(f"{safe_key}.md", {})["author"] = resolved_author
+                written.append(
+                    KnowledgeEntry(key=safe_key, content=content, author=resolved_author)
+                )
+        finally:
+            if written:
+                self._write_knowledge_meta(meta)
+        return written
+
     def rm_knowledge(self, key: str) -> bool:
         self._require_init()
         safe_key = sanitize_key(key)
@@ -411,19 +465,19 @@ class ContextStore:
             return 1
         ids = []
         for f in existing:
-            match = re.match(r"^(\d+)-", f.name)
+            match = _DECISION_ID_RE.match(f.name)
             if match:
                 ids.append(int(match.group(1)))
         return max(ids, default=0) + 1
 
     def list_decisions(self, scope: Scope | None = None) -> list[Decision]:
         self._require_init()
-        smap = self._decisions_scope_map()
+        scopes = self._decisions_scope_map().scopes()
         decisions = []
-        for f in sorted(self.decisions_dir().glob("*.md")):
-            if scope is not None and smap.get(f.name) != scope:
+        for f in sorted(self.decisions_dir().glob("*.md"), key=_BY_NAME):
+            if scope is not None and scopes.get(f.name, Scope.public) != scope:
                 continue
-            match = re.match(r"^(\d+)-", f.name)
+            match = _DECISION_ID_RE.match(f.name)
             did = int(match.group(1)) if match else 0
             text = f.read_text()
             decisions.append(Decision.from_markdown(text, decision_id=did))
@@ -435,7 +489,7 @@ class ContextStore:
         try:
             target_id = int(id_or_title)
             for f in self.decisions_dir().glob("*.md"):
-                match = re.match(r"^(\d+)-", f.name)
+                match = _DECISION_ID_RE.match(f.name)
                 if match and int(match.group(1)) == target_id:
                     return Decision.from_markdown(f.read_text(), decision_id=target_id)
         except ValueError:
@@ -444,7 +498,7 @@ class ContextStore:
         slug = sanitize_key(id_or_title)
         for f in self.decisions_dir().glob("*.md"):
             if slug in f.stem:
-                match = re.match(r"^(\d+)-", f.name)
+                match = _DECISION_ID_RE.match(f.name)
                 did = int(match.group(1)) if match else 0
                 return Decision.from_markdown(f.read_text(), decision_id=did)
         return None
@@ -497,14 +551,11 @@ class ContextStore:
         self._require_init()
         from ctx.core.frontmatter import parse_frontmatter
 
-        smap = self._skills_scope_map()
-        sdir = self.skills_dir()
+        scopes = self._skills_scope_map().scopes()
         entries = []
-        if not sdir.is_dir():
-            return entries
-        for skill_md in sorted(sdir.glob("*/SKILL.md")):
+        for skill_md in scan_skill_files(self.skills_dir()):
             scope_key = f"{skill_md.parent.name}/SKILL.md"
-            if scope is not None and smap.get(scope_key) != scope:
+            if scope is not None and scopes.get(scope_key, Scope.public) != scope:
                 continue
             content = skill_md.read_text()
             meta, _body = parse_frontmatter(content)
@@ -678,14 +729,10 @@ class ContextStore:
     def list_skill_stats(self) -> list[SkillStats]:
         """Return stats for all skills."""
         self._require_init()
-        result = []
-        sdir = self.skills_dir()
-        if not sdir.is_dir():
-            return result
-        for skill_md in sorted(sdir.glob("*/SKILL.md")):
-            name = skill_md.parent.name
-            result.append(self.get_skill_stats(name))
-        return result
+        return [
+            self.get_skill_stats(skill_md.parent.name)
+            for skill_md in scan_skill_files(self.skills_dir())
+        ]
 
     # -- Skill proposals (Phase 7b) --
 
@@ -754,7 +801,7 @@ class ContextStore:
         for pdir in dirs:
             if not pdir.is_dir():
                 continue
-            for f in sorted(pdir.glob("*.json")):
+            for f in sorted(pdir.glob("*.json"), key=_BY_NAME):
                 data = json.loads(f.read_text())
                 p = SkillProposal.model_validate(data)
                 if status is not None and p.status != status:
@@ -888,6 +935,32 @@ class ContextStore:
         self._require_init()
         self._write_json(self.store_dir / "state" / "roadmap.json", roadmap)
 
+    def _imports_path(self) -> Path:
+        return self.store_dir / IMPORTS_FINGERPRINT_FILE
+
+    def _exports_path(self) -> Path:
+        return self.store_dir / EXPORTS_FINGERPRINT_FILE
+
+    def read_import_fingerprint(self, adapter: str) -> list | None:
+        """Return the source fingerprint recorded by the last import from *adapter*."""
+        self._require_init()
+        return _read_fingerprint(self._imports_path(), adapter)
+
+    def write_import_fingerprint(self, adapter: str, fingerprint: list) -> None:
+        """Record the source fingerprint of a completed import (machine-local)."""
+        self._require_init()
+        _write_fingerprint(self._imports_path(), adapter, fingerprint)
+
+    def read_export_fingerprint(self, adapter: str) -> list | None:
+        """Return the fingerprint recorded by the last export to *adapter*."""
+        self._require_init()
+        return _read_fingerprint(self._exports_path(), adapter)
+
+    def write_export_fingerprint(self, adapter: str, fingerprint: list) -> None:
+        """Record the fingerprint of a completed export (machine-local)."""
+        self._require_init()
+        _write_fingerprint(self._exports_path(), adapter, fingerprint)
+
     # -- Team Activity --
 
     def activity_dir(self) -> Path:
@@ -934,7 +1007,7 @@ class ContextStore:
         if not adir.is_dir():
             return []
         entries = []
-        for f in sorted(adir.glob("*.json")):
+        for f in sorted(adir.glob("*.json"), key=_BY_NAME):
             try:
                 entries.append(ActivityEntry.model_validate_json(f.read_text()))
             except Exception:
@@ -1049,6 +1122,31 @@ class ContextStore:
         }
 
 
+def _read_fingerprint(path: Path, adapter: str) -> list | None:
+    """Return *adapter*'s entry in a fingerprint file, or None."""
+    import json
+    try:
+        data = json.loads(path.read_bytes())
+    except (FileNotFoundError, json.JSONDecodeError, UnicodeDecodeError):
+        return None
+    return data.get(adapter) if isinstance(data, dict) else None
+
+
+def _write_fingerprint(path: Path, adapter: str, fingerprint: list) -> None:
+    """Set *adapter*'s entry in a fingerprint file, keeping the others."""
+    import json
+    try:
+        data = json.loads(path.read_bytes())
+    except (FileNotFoundError, json.JSONDecodeError, UnicodeDecodeError):
+        data = {}
+    if not isinstance(data, dict):
+        data = {}
+    data[adapter] = fingerprint
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Shared by every adapter: a torn write would reset all their entries
+    atomic_write_text(path, json.dumps(data) + "\n")
+
+
 def _datetime_from_mtime(path: Path):
     """Get a datetime from a file's mtime."""
     from datetime import datetime, timezone
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import logging
+import re
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 
@@ -21,6 +22,11 @@ from ctx.utils.paths import find_project_root
 
 logger = logging.getLogger(__name__)
 
+# Markdown heading (level hashes, title) and table separator rows, matched
+# line by line in the section/table tools
+_HEADING_RE = re.compile(r"^(#{1,6})\s+(.+)")
+_TABLE_SEPARATOR_RE = re.compile(r"^\|[-:| ]+\|$")
+
 _FALLBACK_INSTRUCTIONS = (
     "Context Teleport provides portable, git-backed context for AI coding agents. "
     "Use resources to read project context and tools to modify it."
@@ -1133,11 +1139,9 @@ def context_outline(key: str) -> str:
     if content is None:
         return json.dumps({"error": f"Entry '{key}' not found"})
 
-    import re
-
     headings: list[dict[str, str | int]] = []
     for i, line in enumerate(content.split("\n"), 1):
-        match = re.match(r"^(#{1,6})\s+(.+)", line)
+        match = _HEADING_RE.match(line)
         if match:
             headings.append({
                 "level": len(match.group(1)),
@@ -1177,13 +1181,11 @@ def context_get_section(key: str, heading: str) -> str:
             })
 
     # Fall back to broader search across all heading levels
-    import re
-
     lines = content.split("\n")
     found_start = -1
     found_level = 0
     for i, line in enumerate(lines):
-        match = re.match(r"^(#{1,6})\s+(.+)", line)
+        match = _HEADING_RE.match(line)
         if match:
             h_text = match.group(2).strip().lower()
             h_level = len(match.group(1))
@@ -1217,8 +1219,6 @@ def context_list_tables(key: str) -> str:
     if content is None:
         return json.dumps({"error": f"Entry '{key}' not found"})
 
-    import re
-
     tables: list[dict] = []
     lines = content.split("\n")
     current_heading = ""
@@ -1226,9 +1226,9 @@ def context_list_tables(key: str) -> str:
     table_start = -1
 
     for i, line in enumerate(lines):
-        h_match = re.match(r"^#{1,6}\s+(.+)", line)
+        h_match = _HEADING_RE.match(line)
         if h_match:
-            current_heading = h_match.group(1).strip()
+            current_heading = h_match.group(2).strip()
 
         is_table_line = "|" in line and line.strip().startswith("|")
         if is_table_line:
@@ -1241,7 +1241,7 @@ def context_list_tables(key: str) -> str:
                     "heading": current_heading,
                     "line": table_start,
                     "content": "\n".join(table_lines),
-                    "rows": len([tl for tl in table_lines if not re.match(r"^\|[-:| ]+\|$", tl.strip())]),
+                    "rows": len([tl for tl in table_lines if not _TABLE_SEPARATOR_RE.match(tl.strip())]),
                 })
                 table_lines = []
 
@@ -1251,7 +1251,7 @@ def context_list_tables(key: str) -> str:
             "heading": current_heading,
             "line": table_start,
             "content": "\n".join(table_lines),
-            "rows": len([tl for tl in table_lines if not re.match(r"^\|[-:| ]+\|$", tl.strip())]),
+            "rows": len([tl for tl in table_lines if not _TABLE_SEPARATOR_RE.match(tl.strip())]),
         })
 
     return json.dumps(tables, indent=2)
@@ -5,12 +5,10 @@ from __future__ import annotations
 import re
 from pathlib import Path
 
-import git
-
 from ctx.core.conflicts import ConflictEntry, ConflictReport, Strategy, resolve_conflicts
 from ctx.core.merge_sections import merge_markdown_sections
 from ctx.core.scope import ScopeMap
-from ctx.utils.paths import STORE_DIR
+from ctx.utils.paths import FINGERPRINT_FILES, STORE_DIR
 
 _PENDING_CONFLICTS_FILE = ".pending_conflicts.json"
 
@@ -23,6 +21,10 @@ class GitSync:
     """Git operations scoped to the .context-teleport/ directory."""
 
     def __init__(self, project_root: Path) -> None:
+        # GitPython is imported on first use: it is the heaviest import on the
+        # MCP server and CLI start-up paths, and most invocations never sync.
+        import git
+
         self.root = project_root.resolve()
         self.store_dir = self.root / STORE_DIR
         try:
@@ -129,8 +131,11 @@ class GitSync:
         return "ctx: update context"
 
     def _get_excluded_files(self) -> set[str]:
-        """Return relative paths (from repo root) of non-public files to exclude."""
-        excluded = set()
+        """Return relative paths (from repo root) of files never to stage.
+
+        Non-public entries, plus the machine-local adapter fingerprints.
+        """
+        excluded = {f"{STORE_DIR}/{name}" for name in FINGERPRINT_FILES}
         knowledge_dir = self.store_dir / "knowledge"
         decisions_dir = knowledge_dir / "decisions"
         conventions_dir = self.store_dir / "conventions"
@@ -222,6 +227,8 @@ class GitSync:
         Args:
             strategy: How to resolve conflicts (ours/theirs/interactive/agent)
         """
+        import git
+
         if not self.repo.remotes:
             return {"status": "no_remote", "error": "No remote configured"}
 
@@ -409,6 +416,8 @@ class GitSync:
         Returns:
             dict with status, strategy, resolved count, skipped count.
         """
+        import git
+
         if not self.repo.remotes:
             return {"status": "error", "error": "No remote configured"}
 
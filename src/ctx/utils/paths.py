@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import os
 import platform
 import re
@@ -10,6 +11,15 @@ from pathlib import Path
 
 STORE_DIR = ".context-teleport"
 
+# Adapter sync fingerprints, relative to STORE_DIR. They record machine-local
+# paths and mtimes, so they are gitignored and never staged by ctx sync.
+IMPORTS_FINGERPRINT_FILE = "state/imports.json"
+EXPORTS_FINGERPRINT_FILE = "state/exports.json"
+FINGERPRINT_FILES = (IMPORTS_FINGERPRINT_FILE, EXPORTS_FINGERPRINT_FILE)
+
+# Runs of anything but word characters (dashes included) collapse to one "-"
+_KEY_UNSAFE_RE = re.compile(r"\W+")
+
 
 def find_project_root(start: Path | None = None) -> Path | None:
     """Walk up from start to find a directory containing .context-teleport/ or .git/."""
@@ -42,6 +52,24 @@ def get_author() -> str:
     return f"{get_username()}@{get_machine_name()}"
 
 
+def executable_on_path(name: str) -> bool:
+    """Return whether an executable called *name* is on PATH.
+
+    Cached per PATH value: ``shutil.which`` walks every PATH entry, and
+    adapters probe for their CLI on every detect(). Keying on PATH keeps
+    long-lived processes (the MCP server) correct if it changes.
+    """
+    return _which_cached(name, os.environ.get("PATH", os.defpath))
+
+
+@functools.lru_cache(maxsize=32)
+def _which_cached(name: str, path: str) -> bool:
+    # shutil drags in the compression modules, which most commands never need
+    import shutil
+
+    return shutil.which(name, path=path) is not None
+
+
 # Claude Code path resolution
 
 
@@ -77,11 +105,13 @@ def find_claude_project_dir(project_root: Path | None = None) -> Path | None:
     candidate = projects / hashed
     if candidate.is_dir():
         return candidate
-    # Fallback: scan for directories that contain the project name
+    # Fallback: scan for directories that contain the project name. scandir
+    # reuses the directory entry types instead of stat'ing every project.
     project_name = root.name
-    for d in projects.iterdir():
-        if d.is_dir() and project_name in d.name:
-            return d
+    with os.scandir(projects) as it:
+        for entry in it:
+            if project_name in entry.name and entry.is_dir():
+                return projects / entry.name
     return None
 
 
@@ -100,11 +130,65 @@ def opencode_data_dir() -> Path:
     return Path.home() / ".local" / "share" / "opencode"
 
 
+def atomic_write_text(path: Path, text: str) -> None:
+    """Write text to path atomically via a sibling temp file and os.replace.
+
+    Readers never see a partially written file, and concurrent writers each
+    get their own temp file, so the last replace wins with a complete file.
+    Symlinks are followed so the link target is replaced rather than the
+    link. An existing file keeps its permission bits; a new one gets the
+    usual umask-derived mode.
+    """
+    import tempfile
+
+    target = path.resolve() if path.is_symlink() else path
+    fd, tmp_name = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+        try:
+            mode = target.stat().st_mode & 0o7777
+        except FileNotFoundError:
+            mode = 0o666 & ~_umask()
+        os.chmod(tmp_name, mode)
+        os.replace(tmp_name, target)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+@functools.cache
+def _umask() -> int:
+    # The umask can only be read by setting it; do that once per process
+    mask = os.umask(0o022)
+    os.umask(mask)
+    return mask
+
+
+def scan_skill_files(skills_dir: Path) -> list[Path]:
+    """Return ``<skills_dir>/<name>/SKILL.md`` for each skill directory, sorted by name.
+
+    One scandir of *skills_dir* (entries carry their type, so no per-entry
+    stat), then one stat per candidate SKILL.md. A missing directory yields
+    an empty list.
+    """
+    try:
+        with os.scandir(skills_dir) as it:
+            dirs = sorted((e.name, e.path) for e in it if e.is_dir())
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+    result = []
+    for _, path in dirs:
+        # Probe with plain strings; only the hits become Path objects
+        skill_md = os.path.join(path, "SKILL.md")
+        if os.path.isfile(skill_md):
+            result.append(Path(skill_md))
+    return result
+
+
 def sanitize_key(key: str) -> str:
     """Sanitize a key for use as a filename (no path traversal, no special chars)."""
-    key = key.strip().lower()
-    key = re.sub(r"[^\w\-]", "-", key)
-    key = re.sub(r"-+", "-", key).strip("-")
+    key = _KEY_UNSAFE_RE.sub("-", key.strip().lower()).strip("-")
     if not key:
         raise ValueError("Key cannot be empty")
     return key
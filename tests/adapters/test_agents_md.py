@@ -35,6 +35,18 @@ class TestParseAgentsMd:
         assert len(sections) == 1
         assert sections[0][0] == "main-title"
 
+    def test_h2_headers_take_precedence_over_h1(self):
+        text = "# Title\nIntro\n\n## First\nOne\n\n## Second\nTwo\n"
+        sections = parse_agents_md(text)
+        assert [s[0] for s in sections] == ["first", "second"]
+        assert sections[0][1] == "## First\nOne"
+
+    def test_tab_separated_header(self):
+        sections = parse_agents_md("##\tTabbed\nBody\n###Not a header\n")
+        assert len(sections) == 1
+        assert sections[0][0] == "tabbed"
+        assert "###Not a header" in sections[0][1]
+
     def test_no_headers_at_all(self):
         text = "Just plain text without any headers."
         sections = parse_agents_md(text)
@@ -45,11 +57,29 @@ class TestParseAgentsMd:
         sections = parse_agents_md("")
         assert sections == []
 
+    def test_whitespace_only_text(self):
+        assert parse_agents_md("  \n\n\t\n") == []
+
     def test_only_managed_section(self):
         text = f"{CTX_AGENTS_START}\n## Managed\nContent\n{CTX_AGENTS_END}\n"
         sections = parse_agents_md(text)
         assert sections == []
 
+    def test_stray_end_marker_before_start(self):
+        text = (
+            f"## Intro\nSee {CTX_AGENTS_END} below\n\n"
+            f"{CTX_AGENTS_START}\n## Managed\nContent\n"
+        )
+        sections = parse_agents_md(text)
+        assert [s[0] for s in sections] == ["intro"]
+        assert sections[0][1].count("## Intro") == 1
+
+    def test_repeated_parse_returns_fresh_list(self):
+        text = "## Setup\nInstall deps\n"
+        first = parse_agents_md(text)
+        first.append(("extra", "mutated"))
+        assert parse_agents_md(text) == [("setup", "## Setup\nInstall deps")]
+
 
 class TestWriteAgentsMdSection:
     def test_write_into_empty(self):
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import io
+import json
 import tarfile
 from pathlib import Path
 
@@ -13,6 +14,7 @@ from ctx.adapters.bundle import (
     export_bundle,
     import_bundle,
 )
+from ctx.core.schema import SessionSummary
 from ctx.core.store import ContextStore
 from ctx.utils.paths import STORE_DIR
 
@@ -97,6 +99,25 @@ class TestBundleDryRun:
         # Verify nothing was actually written
         assert target_store.list_knowledge() == []
 
+    def test_import_dry_run_lists_entries(self, store, tmp_path):
+        store.set_knowledge("arch", "notes")
+        store.add_decision("Use ruff")
+        bundle_path = tmp_path / "preview.ctxbundle"
+        export_bundle(store, bundle_path)
+
+        result = import_bundle(store, bundle_path, dry_run=True)
+        keys = {(i["type"], i["key"]) for i in result["items"]}
+        assert ("knowledge", "arch") in keys
+        assert ("decision", "0001-use-ruff") in keys
+
+    def test_import_dry_run_rejects_path_traversal(self, store, tmp_path):
+        tar_path = _make_malicious_tar(tmp_path, [
+            (f"{STORE_DIR}/manifest.json", "{}"),
+            ("../../evil.txt", "pwned"),
+        ])
+        with pytest.raises(UnsafeBundleError, match="path traversal"):
+            import_bundle(store, tar_path, dry_run=True)
+
     def test_export_dry_run(self, store, tmp_path):
         """Dry run reports what would be bundled without creating archive."""
         store.set_knowledge("dry-test", "content")
@@ -123,3 +144,44 @@ class TestBundleRoundtrip:
 
         assert result["imported"] >= 1
         assert target_store.get_knowledge("roundtrip") is not None
+
+    def test_import_merges_sessions_without_duplicates(self, store, tmp_path):
+        """Sessions already present in the target store are not re-appended."""
+        shared = SessionSummary(agent="claude", summary="shared")
+        store.append_session(shared)
+        store.append_session(SessionSummary(agent="claude", summary="new"))
+        bundle_path = tmp_path / "sessions.ctxbundle"
+        export_bundle(store, bundle_path)
+
+        target = tmp_path / "target"
+        target.mkdir()
+        target_store = ContextStore(target)
+        target_store.init(project_name="target")
+        target_store.append_session(shared)
+
+        import_bundle(target_store, bundle_path)
+
+        summaries = [s.summary for s in target_store.list_sessions()]
+        assert summaries == ["shared", "new"]
+
+    @pytest.mark.parametrize("corrupt", ['{{"id": "{id}", "ag', '{{"id": "{id}", broken}}'])
+    def test_corrupt_existing_session_does_not_block_import(self, store, tmp_path, corrupt):
+        """A corrupt existing line does not count its id as already present."""
+        session = SessionSummary(agent="claude", summary="complete")
+        store.append_session(session)
+        bundle_path = tmp_path / "sessions.ctxbundle"
+        export_bundle(store, bundle_path)
+
+        target = tmp_path / "target"
+        target.mkdir()
+        target_store = ContextStore(target)
+        target_store.init(project_name="target")
+        sessions_path = target_store.store_dir / "history" / "sessions.ndjson"
+        sessions_path.parent.mkdir(parents=True, exist_ok=True)
+        sessions_path.write_text(corrupt.format(id=session.id) + "\n")
+
+        import_bundle(target_store, bundle_path)
+
+        lines = sessions_path.read_text().splitlines()
+        assert len(lines) == 2
+        assert json.loads(lines[1])["summary"] == "complete"
@@ -1,6 +1,7 @@
 """Tests for Codex adapter."""
 
 from ctx.adapters.codex import CodexAdapter
+from ctx.utils.paths import _which_cached, executable_on_path
 
 
 class TestDetect:
@@ -10,10 +11,27 @@ class TestDetect:
         assert adapter.detect() is True
 
     def test_detect_neither(self, store, monkeypatch):
-        monkeypatch.setattr("shutil.which", lambda _: None)
+        monkeypatch.setattr("ctx.adapters.codex.executable_on_path", lambda _: False)
         adapter = CodexAdapter(store)
         assert adapter.detect() is False
 
+    def test_path_lookup_cached(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(
+            "shutil.which", lambda name, path: calls.append(name) or f"/bin/{name}"
+        )
+        monkeypatch.setenv("PATH", "/usr/bin")
+        _which_cached.cache_clear()
+        try:
+            assert executable_on_path("codex") is True
+            assert executable_on_path("codex") is True
+            assert calls == ["codex"]
+            monkeypatch.setenv("PATH", "/opt/codex/bin")
+            assert executable_on_path("codex") is True
+            assert calls == ["codex", "codex"]
+        finally:
+            _which_cached.cache_clear()
+
 
 class TestImport:
     def test_import_agents_md(self, store):
@@ -49,6 +67,17 @@ class TestExport:
         result = adapter.export_context()
         assert result["exported"] == 1
 
+    def test_export_skips_project_instructions(self, store):
+        store.set_knowledge("project-instructions", "Imported from CLAUDE.md")
+        store.set_knowledge("conventions", "Use black formatter")
+        result = CodexAdapter(store).export_context(dry_run=True)
+        assert "1 entries" in result["items"][0]["description"]
+
+        CodexAdapter(store).export_context()
+        content = (store.root / "AGENTS.md").read_text()
+        assert "black formatter" in content
+        assert "Imported from CLAUDE.md" not in content
+
     def test_export_empty(self, store):
         adapter = CodexAdapter(store)
         result = adapter.export_context()
@@ -91,6 +91,18 @@ class TestExport:
         assert "---" in content
         assert "Hexagonal" in content
 
+    def test_export_matches_format_mdc(self, store):
+        store.set_knowledge("arch", "  Hexagonal architecture\n")
+        store.set_convention("style", "Use ruff")
+        CursorAdapter(store).export_context()
+        rules = store.root / ".cursor" / "rules"
+        assert (rules / "ctx-arch.mdc").read_text() == format_mdc(
+            {"description": "Team context: arch", "alwaysApply": True}, "Hexagonal architecture"
+        )
+        assert (rules / "ctx-convention-style.mdc").read_text() == format_mdc(
+            {"description": "Team convention: style", "alwaysApply": True}, "Use ruff"
+        )
+
 
 class TestMcp:
     def test_register(self, store):
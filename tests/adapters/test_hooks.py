@@ -1,6 +1,7 @@
 """Tests for Claude Code lifecycle hooks generation."""
 
 import json
+import os
 
 from ctx.adapters.claude_code import ClaudeCodeAdapter
 
@@ -50,6 +51,11 @@ class TestInstallHooks:
         assert "SessionStart" in settings["hooks"]
         assert "SubagentStart" in settings["hooks"]
 
+    def test_fresh_install_logs_no_warning(self, store, caplog):
+        with caplog.at_level("WARNING"):
+            ClaudeCodeAdapter(store).install_hooks()
+        assert caplog.records == []
+
     def test_install_dry_run(self, store):
         adapter = ClaudeCodeAdapter(store)
         result = adapter.install_hooks(dry_run=True)
@@ -90,6 +96,15 @@ class TestInstallHooks:
         # Only one PreCompact entry (not duplicated)
         assert len(settings["hooks"]["PreCompact"]) == 1
 
+    def test_reinstall_skips_write(self, store):
+        adapter = ClaudeCodeAdapter(store)
+        adapter.install_hooks()
+        settings_path = store.root / ".claude" / "settings.json"
+        os.utime(settings_path, ns=(1, 1))
+
+        assert adapter.install_hooks()["status"] == "installed"
+        assert settings_path.stat().st_mtime_ns == 1
+
     def test_install_handles_corrupted_settings(self, store):
         settings_path = store.root / ".claude" / "settings.json"
         settings_path.parent.mkdir(parents=True, exist_ok=True)
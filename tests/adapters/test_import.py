@@ -0,0 +1,23 @@
+"""Tests for the shared adapter import writer."""
+
+from ctx.adapters._import import write_import_items
+
+
+class TestWriteImportItems:
+    def test_writes_skills_and_knowledge(self, store):
+        items = [
+            {"type": "knowledge", "key": "arch", "source": "AGENTS.md", "content": "Hexagonal"},
+            {"type": "skill", "key": "deploy", "source": "SKILL.md", "content": "Run deploy"},
+            {"type": "other", "key": "ignored", "source": "x", "content": "nope"},
+        ]
+        assert write_import_items(store, items, "codex") == 2
+
+        entry = store.get_knowledge("arch")
+        assert entry.content == "Hexagonal"
+        assert entry.author.startswith("import:codex (")
+        assert store.get_skill("deploy") is not None
+        assert store.get_knowledge("ignored") is None
+
+    def test_empty(self, store):
+        assert write_import_items(store, [], "cursor") == 0
+        assert store.list_knowledge() == []
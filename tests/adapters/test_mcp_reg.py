@@ -1,6 +1,7 @@
 """Tests for shared MCP registration helpers."""
 
 import json
+import os
 
 from ctx.adapters._mcp_reg import (
     register_mcp_json,
@@ -27,6 +28,41 @@ class TestRegisterMcpJson:
         config = json.loads(config_path.read_text())
         assert len(config["mcpServers"]) == 1
 
+    def test_reregister_skips_write(self, tmp_path):
+        config_path = tmp_path / "mcp.json"
+        register_mcp_json(config_path)
+        os.utime(config_path, ns=(0, 0))
+        assert register_mcp_json(config_path)["status"] == "registered"
+        assert config_path.stat().st_mtime_ns == 0
+
+        register_mcp_json(config_path, caller_name="mcp:claude-code")
+        assert config_path.stat().st_mtime_ns != 0
+
+    def test_write_leaves_no_temp_file_and_keeps_mode(self, tmp_path):
+        config_path = tmp_path / "mcp.json"
+        register_mcp_json(config_path)
+        umask = os.umask(0)
+        os.umask(umask)
+        assert config_path.stat().st_mode & 0o777 == 0o666 & ~umask
+
+        config_path.chmod(0o600)
+        register_mcp_json(config_path, caller_name="mcp:claude-code")
+        assert config_path.stat().st_mode & 0o777 == 0o600
+        assert [p.name for p in tmp_path.iterdir()] == ["mcp.json"]
+
+    def test_unreadable_config_warns_instead_of_raising(self, tmp_path, monkeypatch, caplog):
+        config_path = tmp_path / "mcp.json"
+        config_path.write_text("{}")
+
+        def deny(self):
+            raise PermissionError(13, "Permission denied")
+
+        monkeypatch.setattr("pathlib.Path.read_bytes", deny)
+        with caplog.at_level("WARNING", logger="ctx.adapters._mcp_reg"):
+            result = unregister_mcp_json(config_path)
+        assert result["status"] == "not_registered"
+        assert "Failed to read MCP config" in caplog.text
+
     def test_merges_with_existing(self, tmp_path):
         config_path = tmp_path / "mcp.json"
         config_path.write_text(json.dumps({
@@ -44,6 +80,28 @@ class TestRegisterMcpJson:
         config = json.loads(config_path.read_text())
         assert "custom" in config["mcpServers"]
 
+    def test_write_leaves_no_temp_file(self, tmp_path):
+        config_path = tmp_path / "mcp.json"
+        register_mcp_json(config_path)
+        assert [p.name for p in tmp_path.iterdir()] == ["mcp.json"]
+
+    def test_follows_symlinked_config(self, tmp_path):
+        real = tmp_path / "dotfiles" / "mcp.json"
+        real.parent.mkdir()
+        real.write_text("{}")
+        link = tmp_path / "mcp.json"
+        link.symlink_to(real)
+        register_mcp_json(link)
+        assert link.is_symlink()
+        assert SERVER_NAME in json.loads(real.read_text())["mcpServers"]
+
+    def test_overwrites_undecodable_file(self, tmp_path):
+        config_path = tmp_path / "mcp.json"
+        config_path.write_bytes(b"\xff\xfe{not json")
+        register_mcp_json(config_path)
+        config = json.loads(config_path.read_text())
+        assert SERVER_NAME in config["mcpServers"]
+
 
 class TestUnregisterMcpJson:
     def test_removes_entry(self, tmp_path):
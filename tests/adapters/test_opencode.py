@@ -1,6 +1,7 @@
 """Tests for OpenCode adapter."""
 
 import json
+import os
 from pathlib import Path
 
 from ctx.adapters.opencode import OpenCodeAdapter
@@ -19,10 +20,19 @@ class TestDetect:
         assert adapter.detect() is True
 
     def test_detect_neither(self, store, monkeypatch):
-        monkeypatch.setattr("shutil.which", lambda _: None)
+        monkeypatch.setattr("ctx.adapters.opencode.executable_on_path", lambda _: False)
         adapter = OpenCodeAdapter(store)
         assert adapter.detect() is False
 
+    def test_local_marker_skips_path_lookup(self, store, monkeypatch):
+        calls = []
+        monkeypatch.setattr(
+            "ctx.adapters.opencode.executable_on_path", lambda name: calls.append(name)
+        )
+        (store.root / "opencode.json").write_text("{}")
+        assert OpenCodeAdapter(store).detect() is True
+        assert calls == []
+
 
 class TestImport:
     def test_import_agents_md(self, store):
@@ -174,6 +184,23 @@ class TestImportSessions:
         session_items = [i for i in result["items"] if i["key"].startswith("opencode-session-")]
         assert len(session_items) == 20
 
+    def test_project_id_looked_up_once(self, store, monkeypatch):
+        import git
+
+        calls = []
+        real_repo = git.Repo
+
+        def counting_repo(*args, **kwargs):
+            calls.append(args)
+            return real_repo(*args, **kwargs)
+
+        monkeypatch.setattr(git, "Repo", counting_repo)
+        adapter = OpenCodeAdapter(store)
+        first = adapter._get_project_id()
+        assert first is not None
+        assert adapter._get_project_id() == first
+        assert len(calls) == 1
+
     def test_import_sessions_no_data_dir(self, store, monkeypatch, tmp_path):
         """Gracefully skip when data dir doesn't exist."""
         monkeypatch.setenv("OPENCODE_DATA_DIR", str(tmp_path / "nonexistent"))
@@ -206,6 +233,16 @@ class TestExport:
         content = agents.read_text()
         assert "arch" in content
 
+    def test_repeated_export_leaves_agents_md_untouched(self, store):
+        store.set_knowledge("arch", "Architecture notes")
+        adapter = OpenCodeAdapter(store)
+        adapter.export_context()
+        agents = store.root / "AGENTS.md"
+        os.utime(agents, ns=(0, 0))
+
+        assert adapter.export_context()["exported"] == 1
+        assert agents.stat().st_mtime_ns == 0
+
     def test_export_preserves_existing(self, store):
         agents = store.root / "AGENTS.md"
         agents.write_text("## Custom Rules\nMy rules here.\n")
@@ -0,0 +1,44 @@
+"""Tests for the adapter registry."""
+
+import subprocess
+import sys
+
+from ctx.adapters.codex import CodexAdapter
+from ctx.adapters.registry import _ADAPTER_SPECS, detect_adapters, get_adapter, list_adapters
+
+
+class TestRegistry:
+    def test_list_adapters(self):
+        assert list_adapters() == ["claude_code", "opencode", "codex", "gemini", "cursor"]
+
+    def test_get_adapter(self, store):
+        adapter = get_adapter("codex", store)
+        assert isinstance(adapter, CodexAdapter)
+        assert adapter.store is store
+
+    def test_get_unknown_adapter(self, store):
+        assert get_adapter("nope", store) is None
+
+    def test_specs_resolve(self, store):
+        for name in _ADAPTER_SPECS:
+            assert get_adapter(name, store).name == name
+
+    def test_get_adapter_imports_only_that_adapter(self):
+        code = (
+            "import sys\n"
+            "from ctx.adapters import registry\n"
+            "registry._load_adapter_class(registry._ADAPTER_SPECS['codex'])\n"
+            "print(sorted(m for m in sys.modules if m.startswith('ctx.adapters.')))\n"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        assert "ctx.adapters.codex" in out
+        for other in ("claude_code", "opencode", "gemini", "cursor"):
+            assert f"ctx.adapters.{other}'" not in out
+
+    def test_detect_adapters(self, store):
+        (store.root / ".codex").mkdir()
+        detected = detect_adapters(store)
+        assert list(detected) == list_adapters()
+        assert detected["codex"] is True
@@ -0,0 +1,131 @@
+"""Tests for shared adapter directory scanning helpers."""
+
+from ctx.adapters._scan import (
+    ensure_subdirs,
+    fingerprint,
+    read_file,
+    read_file_if_exists,
+    read_texts,
+    scan_files,
+    scan_skill_files,
+    write_file,
+)
+
+
+class TestScanFiles:
+    def test_sorted_matching_files(self, tmp_path):
+        for name in ("b.md", "a.md", "notes.txt"):
+            (tmp_path / name).write_text(name)
+        assert scan_files(tmp_path, ".md") == [tmp_path / "a.md", tmp_path / "b.md"]
+
+    def test_skips_directories(self, tmp_path):
+        (tmp_path / "dir.md").mkdir()
+        (tmp_path / "real.md").write_text("x")
+        assert scan_files(tmp_path, ".md") == [tmp_path / "real.md"]
+
+    def test_missing_directory(self, tmp_path):
+        assert scan_files(tmp_path / "missing", ".md") == []
+
+    def test_path_is_a_file(self, tmp_path):
+        f = tmp_path / "file"
+        f.write_text("x")
+        assert scan_files(f, ".md") == []
+
+
+class TestScanSkillFiles:
+    def test_finds_skill_files_sorted(self, tmp_path):
+        for name in ("zeta", "alpha"):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "SKILL.md").write_text(name)
+        (tmp_path / "empty").mkdir()
+        (tmp_path / "stray.md").write_text("x")
+        assert scan_skill_files(tmp_path) == [
+            tmp_path / "alpha" / "SKILL.md",
+            tmp_path / "zeta" / "SKILL.md",
+        ]
+
+    def test_missing_directory(self, tmp_path):
+        assert scan_skill_files(tmp_path / "missing") == []
+
+
+class TestReadTexts:
+    def test_preserves_order(self, tmp_path):
+        paths = []
+        for i in range(12):
+            p = tmp_path / f"{i:02d}.md"
+            p.write_text(f"content {i}")
+            paths.append(p)
+        assert read_texts(paths) == [f"content {i}" for i in range(12)]
+
+    def test_small_batch(self, tmp_path):
+        p = tmp_path / "one.md"
+        p.write_text("one")
+        assert read_texts([p]) == ["one"]
+        assert read_texts([]) == []
+
+
+class TestReadFile:
+    def test_matches_read_text(self, tmp_path):
+        p = tmp_path / "f.md"
+        p.write_bytes("café\r\nline two\rthree\n".encode())
+        assert read_file(p) == p.read_text()
+
+    def test_large_file(self, tmp_path):
+        p = tmp_path / "big.md"
+        p.write_bytes(("prompt line é\r\n" * 20000).encode())
+        assert read_file(p) == p.read_text()
+
+    def test_empty_file(self, tmp_path):
+        p = tmp_path / "empty.md"
+        p.write_text("")
+        assert read_file(p) == ""
+
+
+class TestReadFileIfExists:
+    def test_existing_file(self, tmp_path):
+        p = tmp_path / "f.md"
+        p.write_text("hello")
+        assert read_file_if_exists(p) == "hello"
+
+    def test_missing_file_and_parent(self, tmp_path):
+        assert read_file_if_exists(tmp_path / "missing.md") is None
+        assert read_file_if_exists(tmp_path / "missing" / "f.md") is None
+
+    def test_directory(self, tmp_path):
+        assert read_file_if_exists(tmp_path) is None
+
+
+class TestFingerprint:
+    def test_skips_missing_and_tracks_changes(self, tmp_path):
+        p = tmp_path / "f.md"
+        p.write_text("one")
+        before = fingerprint([p, tmp_path / "missing.md"])
+        assert [entry[0] for entry in before] == [str(p)]
+        assert fingerprint([p]) == before
+
+        p.write_text("changed")
+        assert fingerprint([p]) != before
+
+
+class TestEnsureSubdirs:
+    def test_creates_missing_only(self, tmp_path):
+        parent = tmp_path / "skills"
+        (parent / "old").mkdir(parents=True)
+        created = ensure_subdirs(parent, ["old", "new", "new"])
+        assert created == {"new"}
+        assert (parent / "new").is_dir()
+        assert (parent / "old").is_dir()
+
+
+class TestWriteFile:
+    def test_creates_and_truncates(self, tmp_path):
+        p = tmp_path / "f.md"
+        write_file(p, "a much longer first version\n")
+        write_file(p, "café\n")
+        assert p.read_bytes() == "café\n".encode()
+
+    def test_large_payload(self, tmp_path):
+        p = tmp_path / "big.md"
+        text = "skill body line\n" * 50000
+        write_file(p, text)
+        assert p.read_text() == text
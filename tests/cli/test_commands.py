@@ -354,6 +354,22 @@ class TestAdapterImportExport:
         data = json.loads(result.output)
         assert data["imported"] >= 1
 
+    def test_reimport_claude_code_reports_unchanged(self, initialized_project):
+        rules_dir = initialized_project / ".claude" / "rules"
+        rules_dir.mkdir(parents=True)
+        (rules_dir / "style.md").write_text("Use ruff\n")
+        assert "Imported 1 items" in runner.invoke(app, ["import", "claude-code"]).output
+        result = runner.invoke(app, ["import", "claude-code"])
+        assert result.exit_code == 0
+        assert "unchanged since the last import" in result.output
+
+    def test_reexport_claude_code_reports_unchanged(self, initialized_project):
+        runner.invoke(app, ["knowledge", "set", "arch", "Architecture notes"])
+        assert "Exported" in runner.invoke(app, ["export", "claude-code"]).output
+        result = runner.invoke(app, ["export", "claude-code"])
+        assert result.exit_code == 0
+        assert "already up to date" in result.output
+
     def test_export_opencode(self, initialized_project):
         runner.invoke(app, ["knowledge", "set", "arch", "Architecture notes"])
         result = runner.invoke(app, ["export", "opencode", "--format", "json"])
@@ -412,3 +428,37 @@ class TestMCPRegistration:
         assert result.exit_code == 0
         data = json.loads(result.output)
         assert data["status"] == "unsupported"
+
+
+class TestGetStore:
+    def test_root_resolved_once_per_cwd(self, project_dir, monkeypatch, tmp_path_factory):
+        from ctx.cli import _shared
+
+        calls = []
+        real = _shared.find_project_root
+        monkeypatch.setattr(_shared, "find_project_root", lambda p: calls.append(p) or real(p))
+        _shared._store_for_cwd.cache_clear()
+        assert _shared.get_store() is _shared.get_store()
+        assert len(calls) == 1
+
+        other = tmp_path_factory.mktemp("other")
+        (other / ".git").mkdir()
+        os.chdir(other)
+        assert _shared.get_store().root == other.resolve()
+        assert len(calls) == 2
+
+
+class TestStartupImports:
+    def test_cli_import_skips_adapter_modules(self):
+        import subprocess
+        import sys
+
+        code = (
+            "import sys\n"
+            "import ctx.cli.main\n"
+            "print([m for m in sys.modules if m.startswith('ctx.adapters')])\n"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        assert out.strip() == "[]"
@@ -72,6 +72,18 @@ class TestScopeMap:
         # Public files are not tracked in the sidecar
         assert scope_map.list_by_scope(Scope.public) == []
 
+    def test_scopes_matches_get(self, scope_map):
+        scope_map.set("a.md", Scope.private)
+        scope_map.set("b.md", Scope.ephemeral)
+        sidecar = scope_map.directory / ".scope.json"
+        data = json.loads(sidecar.read_text())
+        data["c.md"] = "bogus"
+        sidecar.write_text(json.dumps(data))
+        scopes = scope_map.scopes()
+        assert scopes == {"a.md": Scope.private, "b.md": Scope.ephemeral}
+        for name in ("a.md", "b.md", "c.md", "d.md"):
+            assert scopes.get(name, Scope.public) == scope_map.get(name)
+
     def test_missing_sidecar_returns_public(self, tmp_path):
         smap = ScopeMap(tmp_path)
         assert smap.get("anything.md") == Scope.public
@@ -62,6 +62,16 @@ class TestKnowledge:
         entry = store.get_knowledge("my-cool-topic")
         assert entry is not None
 
+    def test_set_many(self, store):
+        store.set_knowledge("existing", "keep", author="alice")
+        written = store.set_knowledge_many(
+            [("First Topic", "one"), ("second", "two")], author="importer"
+        )
+        assert [e.key for e in written] == ["first-topic", "second"]
+        assert store.get_knowledge("first-topic").author == "importer"
+        assert store.get_knowledge("second").content == "two"
+        assert store.get_knowledge("existing").author == "alice"
+
 
 class TestDecisions:
     def test_add_and_get(self, store):
@@ -277,6 +287,14 @@ class TestSkills:
         assert "deploy" in names
         assert "lint" in names
 
+    def test_list_sorted_and_skips_non_skills(self, store):
+        store.set_skill("lint", self._sample_skill("lint", "Run linter"))
+        store.set_skill("deploy", self._sample_skill("deploy", "Deploy"))
+        (store.skills_dir() / "empty").mkdir()
+        (store.skills_dir() / "odd" / "SKILL.md").mkdir(parents=True)
+        assert [e.name for e in store.list_skills()] == ["deploy", "lint"]
+        assert [s.skill_name for s in store.list_skill_stats()] == ["deploy", "lint"]
+
     def test_rm(self, store):
         store.set_skill("temp", self._sample_skill("temp", "Temporary"))
         assert store.rm_skill("temp")
@@ -9,7 +9,7 @@ from ctx.core.conflicts import Strategy
 from ctx.core.scope import Scope
 from ctx.core.store import ContextStore
 from ctx.sync.git_sync import GitSync, GitSyncError
-from ctx.utils.paths import STORE_DIR
+from ctx.utils.paths import EXPORTS_FINGERPRINT_FILE, IMPORTS_FINGERPRINT_FILE, STORE_DIR
 
 
 @pytest.fixture
@@ -228,6 +228,36 @@ class TestStagingIsolation:
         assert "main.py" in staged
 
 
+class TestFingerprintsStayLocal:
+    def _commit_store(self, store):
+        repo = git.Repo(store.root)
+        repo.index.add([".context-teleport"])
+        repo.index.commit("init store")
+        return repo
+
+    def test_fingerprints_never_staged(self, store):
+        repo = self._commit_store(store)
+        store.write_import_fingerprint("claude_code", [["/abs/CLAUDE.md", 1, 2]])
+        store.write_export_fingerprint("claude_code", [["/abs/CLAUDE.md", 3, 4]])
+        store.set_knowledge("arch", "Architecture")
+
+        assert GitSync(store.root).commit()["status"] == "committed"
+
+        committed = {
+            item.path for item in repo.head.commit.tree.traverse() if item.type == "blob"
+        }
+        assert f"{STORE_DIR}/knowledge/arch.md" in committed
+        assert f"{STORE_DIR}/{IMPORTS_FINGERPRINT_FILE}" not in committed
+        assert f"{STORE_DIR}/{EXPORTS_FINGERPRINT_FILE}" not in committed
+
+    def test_fingerprints_alone_are_not_a_change(self, store):
+        self._commit_store(store)
+        store.write_import_fingerprint("codex", [])
+        store.write_export_fingerprint("codex", [])
+
+        assert GitSync(store.root).commit()["status"] == "nothing_to_commit"
+
+
 class TestConflictPersistence:
     def test_save_and_load_report(self, store):
         repo = git.Repo(store.root)